@@ -0,0 +1,206 @@
+"""Compiled, memory-mapped album lookup index.
+
+``album_lookup.csv`` is compiled into a snapshot file that every worker maps
+read-only, so the operating system shares the same pages between processes
+and no per-process dictionaries are built. Lookups binary-search the sorted
+key records directly in the mapping.
+
+File layout (all integers little-endian)::
+
+    header   magic, version, csv size, csv mtime_ns, direct count,
+             normalized count, blob offset
+    direct   sorted records of (artist, title, album) string refs
+    norm     sorted records of (artist, title, album) string refs
+    blob     UTF-8 strings, each stored once
+
+Each string ref is an ``(offset, length)`` pair into the blob. Records are
+sorted by ``(artist bytes, title bytes)``.
+
+Build a snapshot with::
+
+    python album_index.py album_lookup.csv album_lookup.idx
+"""
+
+import argparse
+import csv
+import logging
+import mmap
+import os
+import struct
+from typing import Dict, Iterator, Optional, Tuple
+
+from normalization import normalize_artist, normalize_title
+
+MAGIC = b"ALBIDX\x00\x01"
+VERSION = 1
+_HEADER = struct.Struct("<8sIQQIIQ")
+_RECORD = struct.Struct("<IIIIII")
+
+
+def read_csv(path: str) -> Tuple[Dict[Tuple[str, str], str], Dict[Tuple[str, str], str]]:
+    """Parse the lookup CSV into ``(direct, normalized)`` mappings."""
+    direct = {}
+    normalized = {}
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            title = row.get('title', '').strip().lower()
+            artist = row.get('artist', '').strip().lower()
+            album = row.get('album', '').strip()
+            if title and artist and album:
+                direct[(artist, title)] = album
+                norm_artist = normalize_artist(row.get('artist', ''))
+                norm_title = normalize_title(row.get('title', ''))
+                if norm_artist and norm_title:
+                    normalized[(norm_artist, norm_title)] = album
+    return direct, normalized
+
+
+def build_index(csv_path: str, index_path: str) -> Tuple[int, int]:
+    """Compile ``csv_path`` into ``index_path``; returns the entry counts."""
+    stat = os.stat(csv_path)
+    direct, normalized = read_csv(csv_path)
+
+    blob = bytearray()
+    interned: Dict[str, Tuple[int, int]] = {}
+
+    def intern(value: str) -> Tuple[int, int]:
+        ref = interned.get(value)
+        if ref is None:
+            data = value.encode("utf-8")
+            ref = interned[value] = (len(blob), len(data))
+            blob.extend(data)
+        return ref
+
+    def records(mapping) -> bytes:
+        rows = sorted(
+            ((a.encode("utf-8"), t.encode("utf-8")), a, t, album)
+            for (a, t), album in mapping.items()
+        )
+        out = bytearray()
+        for _, artist, title, album in rows:
+            out += _RECORD.pack(*intern(artist), *intern(title), *intern(album))
+        return bytes(out)
+
+    direct_records = records(direct)
+    normalized_records = records(normalized)
+    blob_offset = _HEADER.size + len(direct_records) + len(normalized_records)
+    header = _HEADER.pack(
+        MAGIC, VERSION, stat.st_size, stat.st_mtime_ns,
+        len(direct), len(normalized), blob_offset,
+    )
+
+    tmp_path = f"{index_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(direct_records)
+        f.write(normalized_records)
+        f.write(blob)
+    # Atomic swap so workers never map a half-written file.
+    os.replace(tmp_path, index_path)
+    return len(direct), len(normalized)
+
+
+class IndexTable:
+    """Read-only ``{(artist, title): album}`` view over one sorted table."""
+
+    def __init__(self, buf, start: int, count: int, blob_offset: int):
+        self._buf = buf
+        self._start = start
+        self._count = count
+        self._blob = blob_offset
+
+    def _string(self, offset: int, length: int) -> bytes:
+        begin = self._blob + offset
+        return self._buf[begin:begin + length]
+
+    def _record(self, i: int):
+        return _RECORD.unpack_from(self._buf, self._start + i * _RECORD.size)
+
+    def get(self, key: Tuple[str, str], default=None) -> Optional[str]:
+        artist, title = key
+        target = (artist.encode("utf-8"), title.encode("utf-8"))
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            a_off, a_len, t_off, t_len, v_off, v_len = self._record(mid)
+            probe = (self._string(a_off, a_len), self._string(t_off, t_len))
+            if probe < target:
+                lo = mid + 1
+            elif probe > target:
+                hi = mid
+            else:
+                return self._string(v_off, v_len).decode("utf-8")
+        return default
+
+    def items(self) -> Iterator[Tuple[Tuple[str, str], str]]:
+        for i in range(self._count):
+            a_off, a_len, t_off, t_len, v_off, v_len = self._record(i)
+            key = (
+                self._string(a_off, a_len).decode("utf-8"),
+                self._string(t_off, t_len).decode("utf-8"),
+            )
+            yield key, self._string(v_off, v_len).decode("utf-8")
+
+    def keys(self) -> Iterator[Tuple[str, str]]:
+        for key, _ in self.items():
+            yield key
+
+    def __iter__(self):
+        return self.keys()
+
+    def __len__(self):
+        return self._count
+
+
+class AlbumIndex:
+    """A memory-mapped snapshot produced by :func:`build_index`."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.csv_size, self.csv_mtime_ns,
+         n_direct, n_normalized, blob_offset) = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} is not an album index snapshot")
+        normalized_start = _HEADER.size + n_direct * _RECORD.size
+        self.direct = IndexTable(self._mmap, _HEADER.size, n_direct, blob_offset)
+        self.normalized = IndexTable(self._mmap, normalized_start, n_normalized, blob_offset)
+
+    def matches(self, csv_path: str) -> bool:
+        """Return True if the snapshot was built from the current CSV."""
+        try:
+            stat = os.stat(csv_path)
+        except OSError:
+            # Nothing to compare against; trust the snapshot.
+            return True
+        return stat.st_size == self.csv_size and stat.st_mtime_ns == self.csv_mtime_ns
+
+
+def open_index(index_path: str, csv_path: str) -> Optional[AlbumIndex]:
+    """Open ``index_path`` if it exists and is up to date with ``csv_path``."""
+    if not os.path.exists(index_path):
+        return None
+    try:
+        index = AlbumIndex(index_path)
+    except Exception as e:
+        logging.warning(f"Could not open album index {index_path}: {e}")
+        return None
+    if not index.matches(csv_path):
+        logging.warning(f"Album index {index_path} is older than {csv_path}, falling back to CSV")
+        return None
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the album lookup CSV into a snapshot.")
+    parser.add_argument("csv", nargs="?", default=os.getenv("ALBUM_LOOKUP_CSV", "album_lookup.csv"))
+    parser.add_argument("index", nargs="?", help="output path (default: CSV path with .idx suffix)")
+    args = parser.parse_args()
+    index_path = args.index or os.path.splitext(args.csv)[0] + ".idx"
+    n_direct, n_normalized = build_index(args.csv, index_path)
+    print(f"Wrote {index_path}: {n_direct} entries, {n_normalized} normalized ({os.path.getsize(index_path)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
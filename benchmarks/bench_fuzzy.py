@@ -0,0 +1,146 @@
+"""Measure latency and hit rate of the fuzzy album lookup.
+
+Run from the project root:
+
+    python benchmarks/bench_fuzzy.py [path/to/album_lookup.csv] [replay.json ...]
+
+Without replay files every CSV row is replayed with a small perturbation of
+the kind seen in upstream tags (a typo, a dropped or swapped character, a
+missing "The", punctuation changes) and the fuzzy index must return the
+row's album. Rows paired with another artist's title are replayed as
+negatives and must not match.
+
+Replay files are saved upstream responses (a JSON list of tracks with
+``TPE1``/``TIT2``), e.g. a feed's ``source`` URL from ``feeds.json`` saved
+with ``curl``. For those the tracks that miss the exact lookups are counted
+as fuzzy hits or misses.
+"""
+
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import album_index  # noqa: E402
+from fuzzy_index import FuzzyIndex  # noqa: E402
+from normalization import normalize_artist, normalize_title  # noqa: E402
+
+
+def perturb(text, rng):
+    """Apply one random tag-style edit to ``text``."""
+    if len(text) < 4:
+        return text + "!"
+    i = rng.randrange(1, len(text) - 1)
+    kind = rng.choice(("substitute", "delete", "insert", "transpose", "punctuate"))
+    if kind == "substitute":
+        return text[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + text[i + 1:]
+    if kind == "delete":
+        return text[:i] + text[i + 1:]
+    if kind == "insert":
+        return text[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + text[i:]
+    if kind == "transpose":
+        return text[:i - 1] + text[i] + text[i - 1] + text[i + 1:]
+    return text.replace(" ", ", ", 1) if " " in text else text + "."
+
+
+def exact_album(direct, normalized, artist, title):
+    """Mirror of the exact-key lookups in ``main.get_csv_album``."""
+    artist_key, title_key = artist.strip().lower(), title.strip().lower()
+    norm_artist, norm_title = normalize_artist(artist), normalize_title(title)
+    return (
+        direct.get((artist_key, title_key))
+        or normalized.get((norm_artist, norm_title))
+        or direct.get((artist_key, norm_title))
+        or direct.get((norm_artist, title_key))
+    )
+
+
+def timed_lookups(index, queries):
+    """Return per-query results and latencies (seconds) on a cold memo."""
+    index._cache.clear()
+    results, latencies = [], []
+    for artist, title in queries:
+        start = time.perf_counter()
+        results.append(index.lookup(normalize_artist(artist), normalize_title(title)))
+        latencies.append(time.perf_counter() - start)
+    return results, latencies
+
+
+def report_latency(name, latencies):
+    ordered = sorted(latencies)
+    pct = lambda p: ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1e6  # noqa: E731
+    print(
+        f"{name:<12} n={len(ordered):<6} mean {sum(ordered) / len(ordered) * 1e6:7.1f} us"
+        f"  p50 {pct(0.5):7.1f} us  p99 {pct(0.99):7.1f} us  max {ordered[-1] * 1e6:7.1f} us"
+    )
+
+
+def synthetic(direct, normalized, index, rng):
+    rows = [(a, t, album) for (a, t), album in direct.items()]
+    positives, expected = [], []
+    for artist, title, album in rows:
+        if rng.random() < 0.2 and artist.startswith("the "):
+            artist = artist[4:]
+        else:
+            title = perturb(title, rng)
+        if exact_album(direct, normalized, artist, title):
+            continue
+        positives.append((artist, title))
+        expected.append(album)
+
+    shuffled = rows[:]
+    rng.shuffle(shuffled)
+    negatives = [
+        (a, t2) for (a, _, album), (_, t2, album2) in zip(rows, shuffled)
+        if album != album2 and not exact_album(direct, normalized, a, t2)
+    ]
+
+    results, latencies = timed_lookups(index, positives)
+    correct = sum(r == e for r, e in zip(results, expected))
+    wrong = sum(r is not None and r != e for r, e in zip(results, expected))
+    print(f"perturbed:   {correct}/{len(positives)} recovered ({correct / len(positives):.1%}), {wrong} wrong album")
+    report_latency("positives", latencies)
+
+    results, latencies = timed_lookups(index, negatives)
+    false_hits = sum(r is not None for r in results)
+    print(f"negatives:   {false_hits}/{len(negatives)} false matches ({false_hits / len(negatives):.2%})")
+    report_latency("negatives", latencies)
+
+
+def replay(path, direct, normalized, index):
+    with open(path, encoding="utf-8") as f:
+        tracks = json.load(f)
+    queries = [(t.get("TPE1", ""), t.get("TIT2", "")) for t in tracks if t.get("TPE1") and t.get("TIT2")]
+    exact = [q for q in queries if exact_album(direct, normalized, *q)]
+    missed = [q for q in queries if not exact_album(direct, normalized, *q)]
+    results, latencies = timed_lookups(index, missed)
+    hits = sum(r is not None for r in results)
+    print(f"{os.path.basename(path)}: {len(queries)} tracks, {len(exact)} exact, {hits} fuzzy, {len(missed) - hits} miss")
+    for (artist, title), album in zip(missed, results):
+        if album:
+            print(f"  {artist} - {title} -> {album}")
+    if latencies:
+        report_latency("replay", latencies)
+
+
+def main():
+    args = sys.argv[1:]
+    csv_path = args.pop(0) if args and args[0].endswith(".csv") else "album_lookup.csv"
+    direct, normalized = album_index.read_csv(csv_path)
+
+    start = time.perf_counter()
+    index = FuzzyIndex(normalized.items())
+    print(f"built index over {len(index)} entries in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    if args:
+        for path in args:
+            replay(path, direct, normalized, index)
+    else:
+        synthetic(direct, normalized, index, random.Random(1234))
+
+
+if __name__ == "__main__":
+    main()
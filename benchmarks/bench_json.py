@@ -0,0 +1,145 @@
+"""Compare the per-request JSONResponse path with pre-encoded feed bytes.
+
+Run from the project root:
+
+    python benchmarks/bench_json.py [requests]
+
+A synthetic 12-track feed is served by two minimal FastAPI apps:
+
+* ``JSONResponse`` – the original handlers, which encode ``nowPlaying``
+  with the stdlib encoder on every request;
+* ``pre-encoded`` – the current path, which returns bytes encoded once per
+  render through a raw ``Response``.
+
+Requests are driven straight through the ASGI interface, so the numbers
+reflect work done inside the app rather than the network stack. The
+encoders are also timed on their own, including the Redis round trip of
+the raw upstream tracks, with orjson when it is installed.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.responses import JSONResponse, Response  # noqa: E402
+
+import main  # noqa: E402
+
+
+def synthetic_feed(n=12):
+    raw = [
+        {
+            "TPE1": f"Artist Number {i}",
+            "TIT2": f"A Fairly Typical Hymn Title {i} (Live)",
+            "TALB": f"Collected Works, Vol. {i}",
+            "played_on": str(1700000000 - i * 200),
+            "duration": "00:03:20",
+        }
+        for i in range(n)
+    ]
+    now_playing = [
+        {
+            "id": f"{i:040x}",
+            "artist": t["TPE1"],
+            "title": t["TIT2"],
+            "album": t["TALB"],
+            "time": "2023-11-14T16:13:20-06:00",
+            "imageUrl": f"https://is1-ssl.mzstatic.com/image/thumb/Music/{i}/600x600bb.jpg",
+            "itunesTrackUrl": f"https://music.apple.com/us/album/{i}",
+            "previewUrl": f"https://audio-ssl.itunes.apple.com/preview/{i}.m4a",
+            "duration": "00:03:20",
+            "status": "playing" if i == 0 else "history",
+            "type": "song",
+        }
+        for i, t in enumerate(raw)
+    ]
+    return raw, now_playing
+
+
+def build_apps(now_playing):
+    before = FastAPI()
+    after = FastAPI()
+    body = main.json_dumpb({"nowPlaying": now_playing})
+
+    @before.get("/east-feed.json")
+    async def feed_before():
+        return JSONResponse(content={"nowPlaying": now_playing})
+
+    @after.get("/east-feed.json")
+    async def feed_after():
+        return Response(content=body, media_type="application/json")
+
+    return before, after
+
+
+async def drive(app, requests):
+    """Send ``requests`` GETs through ``app`` and return requests/sec."""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": "/east-feed.json", "raw_path": b"/east-feed.json",
+        "root_path": "", "query_string": b"", "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 1234), "server": ("localhost", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    sent = []
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            sent.append(len(message.get("body", b"")))
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    elapsed = time.perf_counter() - start
+    return requests / elapsed, sent[-1]
+
+
+def encoder_timings(raw, now_playing):
+    payload = {"nowPlaying": now_playing}
+    stored = json.dumps(raw)
+    number = 20000
+
+    def per_call(fn):
+        return min(timeit.repeat(fn, repeat=5, number=number)) / number * 1e6
+
+    rows = [
+        ("feed encode, stdlib", per_call(lambda: json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode())),
+        ("feed encode, json_dumpb", per_call(lambda: main.json_dumpb(payload))),
+        ("redis round trip, stdlib", per_call(lambda: json.loads(json.dumps(raw)))),
+        ("redis round trip, json_*", per_call(lambda: main.json_loads(main.json_dumps(raw)))),
+        ("redis decode, stdlib", per_call(lambda: json.loads(stored))),
+        ("redis decode, json_loads", per_call(lambda: main.json_loads(stored))),
+    ]
+    backend = "orjson" if main.ORJSON_AVAILABLE else "stdlib"
+    print(f"encoders (json_* backend: {backend})")
+    for name, us in rows:
+        print(f"  {name:<28} {us:7.2f} us")
+
+
+def run():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    raw, now_playing = synthetic_feed()
+    encoder_timings(raw, now_playing)
+
+    before, after = build_apps(now_playing)
+    print(f"\nASGI requests ({requests} each, 12-track feed)")
+    results = {}
+    for name, app in (("JSONResponse", before), ("pre-encoded", after)):
+        asyncio.run(drive(app, 200))  # warm up
+        rps, size = asyncio.run(drive(app, requests))
+        results[name] = rps
+        print(f"  {name:<14} {rps:9.0f} req/s  ({size} bytes)")
+    print(f"  speedup        {results['pre-encoded'] / results['JSONResponse']:9.2f}x")
+
+
+if __name__ == "__main__":
+    run()
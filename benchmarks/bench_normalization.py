@@ -0,0 +1,113 @@
+"""Compare the normalization module against the original regex functions.
+
+Run from the project root:
+
+    python benchmarks/bench_normalization.py [path/to/album_lookup.csv]
+
+Every CSV row is first checked to produce identical output with both
+implementations, then each variant is timed over all rows.
+"""
+
+import csv
+import os
+import re
+import sys
+import timeit
+import unicodedata
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import normalization  # noqa: E402
+
+
+# Original implementations, kept here as the baseline.
+def _legacy_strip_accents(value: str) -> str:
+    normalized = unicodedata.normalize("NFKD", value)
+    return "".join(ch for ch in normalized if not unicodedata.combining(ch))
+
+
+def _legacy_normalize_whitespace(text: str) -> str:
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def legacy_normalize_artist(artist: str) -> str:
+    artist = _legacy_strip_accents(artist).lower()
+    artist = artist.replace("&", " and ")
+    artist = re.sub(r"^the\s+", "", artist)
+    artist = re.sub(r"[^a-z0-9]+", " ", artist)
+    return _legacy_normalize_whitespace(artist)
+
+
+def legacy_normalize_title(title: str) -> str:
+    title = _legacy_strip_accents(title)
+    title = re.sub(r"\b(feat\.?|ft\.?|featuring)\b.*", "", title, flags=re.IGNORECASE)
+    title = re.sub(r"[\(\[].*?[\)\]]", "", title)
+    title = re.sub(r"\s+[-–—]\s+.*", "", title)
+    title = re.sub(r"[^a-zA-Z0-9]+", " ", title)
+    return _legacy_normalize_whitespace(title.lower())
+
+
+def legacy_normalize_album(album: str) -> str:
+    album = _legacy_strip_accents(album).lower()
+    album = album.replace("&", " and ")
+    album = re.sub(r"[^a-z0-9]+", " ", album)
+    return _legacy_normalize_whitespace(album)
+
+
+def load_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return [
+            (row.get("artist", ""), row.get("title", ""), row.get("album", ""))
+            for row in csv.DictReader(f)
+        ]
+
+
+def run_all(rows, artist_fn, title_fn, album_fn):
+    for artist, title, album in rows:
+        artist_fn(artist)
+        title_fn(title)
+        album_fn(album)
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else "album_lookup.csv"
+    rows = load_rows(path)
+
+    mismatches = 0
+    for artist, title, album in rows:
+        pairs = (
+            (legacy_normalize_artist(artist), normalization.normalize_artist(artist)),
+            (legacy_normalize_title(title), normalization.normalize_title(title)),
+            (legacy_normalize_album(album), normalization.normalize_album(album)),
+        )
+        for old, new in pairs:
+            if old != new:
+                mismatches += 1
+                print(f"MISMATCH: {old!r} != {new!r}")
+    print(f"{len(rows)} rows, {mismatches} mismatches")
+
+    legacy = (legacy_normalize_artist, legacy_normalize_title, legacy_normalize_album)
+    fast = (normalization.normalize_artist, normalization.normalize_title, normalization.normalize_album)
+    uncached = tuple(fn.__wrapped__ for fn in fast)
+
+    def cold():
+        normalization.clear_caches()
+        run_all(rows, *fast)
+
+    variants = (
+        ("legacy regex", lambda: run_all(rows, *legacy)),
+        ("compiled, no memo", lambda: run_all(rows, *uncached)),
+        ("compiled, cold memo", cold),
+        ("compiled, warm memo", lambda: run_all(rows, *fast)),
+    )
+    repeat, number = 5, 10
+    baseline = None
+    for name, fn in variants:
+        best = min(timeit.repeat(fn, repeat=repeat, number=number)) / number
+        per_row_us = best / len(rows) * 1e6
+        baseline = baseline or best
+        print(f"{name:<22} {best * 1000:8.2f} ms/pass  {per_row_us:6.2f} us/row  {baseline / best:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Hold many Server-Sent Events connections open against a running app.
+
+Run against a local or deployed instance:
+
+    python benchmarks/loadtest_sse.py --url http://localhost:5000/east-feed/events \\
+        --clients 2000 --duration 60
+
+Clients connect over ``--ramp`` seconds and stay connected for
+``--duration`` seconds. Every stream response names the worker that
+serves it (``X-Worker``, sent when the app runs with
+``FEED_STREAM_WORKER_HEADER=1``), so the report shows how many connections
+each worker holds, along with connect failures, time to first event and the
+number of events and keep-alives received.
+"""
+
+import argparse
+import asyncio
+import collections
+import statistics
+import time
+
+import httpx
+
+
+class Stats:
+    def __init__(self):
+        self.workers = collections.Counter()
+        self.open = 0
+        self.peak_open = 0
+        self.failed = collections.Counter()
+        self.first_event = []
+        self.events = 0
+        self.keepalives = 0
+        self.dropped = 0
+
+
+async def client(http, url, stats, deadline):
+    start = time.perf_counter()
+    try:
+        async with http.stream("GET", url) as response:
+            if response.status_code != 200:
+                stats.failed[f"HTTP {response.status_code}"] += 1
+                return
+            stats.workers[response.headers.get("x-worker", "?")] += 1
+            stats.open += 1
+            stats.peak_open = max(stats.peak_open, stats.open)
+            try:
+                got_first = False
+                lines = response.aiter_lines()
+                while True:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        return
+                    try:
+                        line = await asyncio.wait_for(lines.__anext__(), remaining)
+                    except (asyncio.TimeoutError, StopAsyncIteration):
+                        if time.perf_counter() < deadline:
+                            stats.dropped += 1  # server ended the stream early
+                        return
+                    if line.startswith("data:"):
+                        stats.events += 1
+                        if not got_first:
+                            got_first = True
+                            stats.first_event.append(time.perf_counter() - start)
+                    elif line.startswith(":"):
+                        stats.keepalives += 1
+            finally:
+                stats.open -= 1
+    except httpx.HTTPError as e:
+        stats.failed[type(e).__name__] += 1
+
+
+async def report(stats, until):
+    while time.perf_counter() < until:
+        await asyncio.sleep(5)
+        print(f"  open {stats.open:6d}  events {stats.events:7d}  failed {sum(stats.failed.values()):5d}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:5000/east-feed/events")
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=30, help="seconds each client stays connected")
+    parser.add_argument("--ramp", type=float, default=10, help="seconds over which clients connect")
+    args = parser.parse_args()
+
+    stats = Stats()
+    limits = httpx.Limits(max_connections=args.clients, max_keepalive_connections=0)
+    timeout = httpx.Timeout(30, read=None)
+    async with httpx.AsyncClient(limits=limits, timeout=timeout) as http:
+        start = time.perf_counter()
+        tasks = []
+        for i in range(args.clients):
+            connect_at = start + args.ramp * i / args.clients
+            await asyncio.sleep(max(0, connect_at - time.perf_counter()))
+            tasks.append(asyncio.create_task(client(http, args.url, stats, connect_at + args.duration)))
+        monitor = asyncio.create_task(report(stats, start + args.ramp + args.duration))
+        await asyncio.gather(*tasks)
+        monitor.cancel()
+
+    print(f"\n{args.clients} clients, peak {stats.peak_open} concurrent streams")
+    for worker, count in sorted(stats.workers.items()):
+        print(f"  worker {worker}: {count} connections")
+    if stats.failed:
+        print("  failed: " + ", ".join(f"{k} x{v}" for k, v in stats.failed.items()))
+    if stats.first_event:
+        ordered = sorted(stats.first_event)
+        print(
+            f"  first event: median {statistics.median(ordered) * 1000:.1f} ms, "
+            f"p99 {ordered[int(len(ordered) * 0.99) - 1] * 1000:.1f} ms"
+        )
+    print(f"  events {stats.events}, keep-alives {stats.keepalives}, closed early {stats.dropped}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
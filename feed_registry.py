@@ -0,0 +1,85 @@
+"""Feed registry loaded from ``feeds.json`` (or YAML when PyYAML is installed).
+
+Every station is one entry; the app, the dashboard and ``latency_monitor.py``
+all read the same file, so adding a feed needs no code changes::
+
+    {
+      "defaults": {"poll_interval": 10, "concurrency": 4},
+      "feeds": [
+        {"name": "east", "label": "East Feed (WFME)",
+         "source": "https://yp.cdnstream1.com/metadata/2632_128/last/12.json"}
+      ]
+    }
+
+Per-feed keys: ``name`` (required, served at ``/{name}-feed.json``),
+``source`` (required, upstream metadata URL), ``label``, ``poll_interval``,
+``soft_ttl``, ``hard_ttl`` and ``concurrency``. Missing values come from the
+file's ``defaults`` and then from the caller's defaults.
+"""
+
+import importlib.util
+import json
+import os
+import re
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+FEED_NAME_RE = re.compile(r"^[a-z0-9_]+$")
+
+
+@dataclass(frozen=True)
+class FeedConfig:
+    name: str
+    source: str
+    label: str
+    poll_interval: float
+    soft_ttl: int
+    hard_ttl: int
+    concurrency: int
+
+
+def _read(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            if importlib.util.find_spec("yaml") is None:
+                raise RuntimeError(f"{path} is YAML but PyYAML is not installed")
+            import yaml
+            return yaml.safe_load(f) or {}
+        return json.load(f)
+
+
+def load_feeds(path: str, defaults: Optional[dict] = None) -> Dict[str, FeedConfig]:
+    """Return ``{name: FeedConfig}`` in file order; raises ``ValueError`` on bad entries."""
+    raw = _read(path)
+    base = {
+        "poll_interval": 10,
+        "soft_ttl": 30,
+        "hard_ttl": 3600,
+        "concurrency": 4,
+        **(defaults or {}),
+        **raw.get("defaults", {}),
+    }
+    feeds = {}
+    for entry in raw.get("feeds", []):
+        name = str(entry.get("name", ""))
+        if not FEED_NAME_RE.match(name):
+            raise ValueError(f"{path}: invalid feed name {name!r} (use a-z, 0-9 and _)")
+        if name in feeds:
+            raise ValueError(f"{path}: duplicate feed {name!r}")
+        if not entry.get("source"):
+            raise ValueError(f"{path}: feed {name!r} has no source")
+        settings = {**base, **entry}
+        feeds[name] = FeedConfig(
+            name=name,
+            source=settings["source"],
+            label=settings.get("label") or name.capitalize(),
+            poll_interval=float(settings["poll_interval"]),
+            soft_ttl=int(settings["soft_ttl"]),
+            hard_ttl=int(settings["hard_ttl"]),
+            concurrency=max(1, int(settings["concurrency"])),
+        )
+    return feeds
+
+
+def default_path() -> str:
+    return os.getenv("FEED_REGISTRY", "feeds.json")
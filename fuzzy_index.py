@@ -0,0 +1,135 @@
+"""Approximate ``(artist, title)`` matching for the album lookup.
+
+Upstream TPE1/TIT2 tags often differ from the CSV by a typo, a dropped word
+or punctuation, so the exact-key lookups miss. This index is built once per
+load over the *normalized* keys:
+
+* every key ``"artist title"`` is split into character trigrams and each
+  trigram maps to the entries containing it (an inverted index);
+* a query counts shared trigrams per entry and ranks the candidates by the
+  Dice coefficient ``2 * shared / (len(query) + len(candidate))``;
+* the leading candidates are verified with :class:`difflib.SequenceMatcher`
+  and accepted only if the artist and the title each reach ``threshold``,
+  so a prolific artist alone cannot carry a different song over the line.
+
+Very common trigrams (present in more than ``max_posting_ratio`` of the
+entries) are left out of the inverted index; they add cost without narrowing the
+candidates. Query results are memoized per index instance.
+"""
+
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Default minimum similarity ratio of both artist and title for a match.
+DEFAULT_THRESHOLD = 0.85
+# Candidates sharing fewer trigrams than this (Dice) are not verified.
+DEFAULT_MIN_OVERLAP = 0.5
+
+
+def trigrams(text: str) -> set:
+    """Return the set of character trigrams of ``text`` padded with spaces."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _ratio(a: str, b: str, cutoff: float) -> float:
+    """Similarity ratio of ``a`` and ``b``; 0.0 once it is known to be below ``cutoff``."""
+    if a == b:
+        return 1.0
+    matcher = SequenceMatcher(None, a, b, autojunk=False)
+    if matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff:
+        return 0.0
+    return matcher.ratio()
+
+
+class FuzzyIndex:
+    """Trigram index over normalized ``(artist, title) -> album`` entries."""
+
+    def __init__(
+        self,
+        items: Iterable[Tuple[Tuple[str, str], str]],
+        threshold: float = DEFAULT_THRESHOLD,
+        min_overlap: float = DEFAULT_MIN_OVERLAP,
+        max_posting_ratio: float = 0.05,
+        candidates: int = 8,
+        cache_size: int = 4096,
+    ):
+        self.threshold = threshold
+        self.min_overlap = min_overlap
+        self.candidates = candidates
+        self._cache_size = cache_size
+        self._cache: Dict[Tuple[str, str], Optional[str]] = {}
+        self._keys: List[Tuple[str, str]] = []
+        self._albums: List[str] = []
+        postings = defaultdict(list)
+        for (artist, title), album in items:
+            entry = len(self._keys)
+            self._keys.append((artist, title))
+            self._albums.append(album)
+            for gram in trigrams(f"{artist} {title}"):
+                postings[gram].append(entry)
+
+        max_posting = max(64, int(len(self._keys) * max_posting_ratio))
+        self._postings = {
+            gram: tuple(entries)
+            for gram, entries in postings.items()
+            if len(entries) <= max_posting
+        }
+        # Sizes count indexed trigrams only, so overlap scores stay
+        # comparable after pruning.
+        self._sizes = [0] * len(self._keys)
+        for entries in self._postings.values():
+            for entry in entries:
+                self._sizes[entry] += 1
+
+    def __len__(self):
+        return len(self._keys)
+
+    def lookup(self, artist: str, title: str) -> Optional[str]:
+        """Return the album of the closest entry, or None below the threshold."""
+        query = (artist, title)
+        if query in self._cache:
+            return self._cache[query]
+        result = self._lookup(artist, title)
+        if len(self._cache) >= self._cache_size:
+            self._cache.clear()
+        self._cache[query] = result
+        return result
+
+    def _lookup(self, artist: str, title: str) -> Optional[str]:
+        if not title:
+            return None
+        lists = [
+            entries for entries in map(self._postings.get, trigrams(f"{artist} {title}"))
+            if entries
+        ]
+        if not lists:
+            return None
+        shared = Counter(chain.from_iterable(lists))
+
+        # Take the entries sharing the most trigrams, rank them by overlap,
+        # then verify with an edit-based ratio, which separates "grase" /
+        # "grace" from "me" / "you" better than trigrams do on short titles.
+        n = len(lists)
+        ranked = sorted(
+            ((2 * count / (n + self._sizes[entry]), entry)
+             for entry, count in shared.most_common(self.candidates * 4)),
+            reverse=True,
+        )[:self.candidates]
+        best_score, best_entry = 0.0, None
+        for overlap, entry in ranked:
+            if overlap < self.min_overlap:
+                break
+            cand_artist, cand_title = self._keys[entry]
+            title_score = _ratio(title, cand_title, self.threshold)
+            if title_score < self.threshold:
+                continue
+            artist_score = _ratio(artist, cand_artist, self.threshold)
+            if artist_score < self.threshold:
+                continue
+            score = title_score + artist_score
+            if score > best_score:
+                best_score, best_entry = score, entry
+        return None if best_entry is None else self._albums[best_entry]
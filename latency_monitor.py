@@ -2,16 +2,17 @@ import requests
 import time
 import os
 
+import feed_registry
+
 PAGERDUTY_KEY = os.getenv("PD_ROUTING_KEY", "")
 ALERT_THRESHOLD = 10  # seconds
 
+# Public base URL of the deployed app; feeds come from the shared registry.
+FEED_BASE_URL = os.getenv("FEED_BASE_URL", "https://metadata.fr-infra.com").rstrip("/")
+
 FEEDS = {
-    "east": "https://metadata.fr-infra.com/east-feed.json",
-    "west": "https://metadata.fr-infra.com/west-feed.json",
-    "worship": "https://metadata.fr-infra.com/worship-feed.json",
-    "fourth": "https://metadata.fr-infra.com/fourth-feed.json",
-    "fifth": "https://metadata.fr-infra.com/fifth-feed.json",
-    "sixth": "https://metadata.fr-infra.com/sixth-feed.json"
+    name: f"{FEED_BASE_URL}/{name}-feed.json"
+    for name in feed_registry.load_feeds(feed_registry.default_path())
 }
 
 def send_pagerduty_alert(feed_name, latency):
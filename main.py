@@ -1,26 +1,38 @@
-from fastapi import FastAPI, Depends, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import FastAPI, Depends, Request, WebSocket
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
-from datetime import datetime
+from datetime import datetime, timedelta
+from email.utils import formatdate, parsedate_to_datetime
 from pytz import timezone
 from contextlib import asynccontextmanager
+from collections import OrderedDict
+from dataclasses import dataclass, field
 import httpx
 import asyncio
+import base64
+import bisect
+import gzip
 import json
 import logging
 import os
-import csv
 import redis.asyncio as redis
 import hashlib
+import importlib.util
 import secrets
+import time
 import functools
 import re
-import unicodedata
+import zlib
 import sacad
+import album_index
+import feed_registry
+import html
+from fuzzy_index import FuzzyIndex
+from normalization import normalize_album, normalize_artist, normalize_title
 from sacad.cover import CoverSourceResult
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 logging.basicConfig(level=logging.INFO)
 logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -39,54 +51,190 @@ REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
 rdb = redis.Redis(host=REDIS_HOST, port=REDIS_PORT, decode_responses=True)
 
-# CSV file used for album lookup. Can be overridden with environment variable.
-ALBUM_LOOKUP_CSV = os.getenv("ALBUM_LOOKUP_CSV", "album_lookup.csv")
+# ---------------------------------------------------------------------------
+# JSON encoding
+# ---------------------------------------------------------------------------
+
+# orjson is used when installed; the stdlib encoder produces the same compact
+# output otherwise.
+ORJSON_AVAILABLE = importlib.util.find_spec("orjson") is not None
+if ORJSON_AVAILABLE:
+    import orjson
+
+
+def json_dumpb(value, sort_keys: bool = False) -> bytes:
+    """Encode ``value`` as compact UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(
+        value,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+        sort_keys=sort_keys,
+    ).encode("utf-8")
+
+
+def json_dumps(value, sort_keys: bool = False) -> str:
+    """Encode ``value`` as a compact JSON string (e.g. for Redis)."""
+    return json_dumpb(value, sort_keys).decode("utf-8")
 
-# In-memory mapping {(artist_lower, title_lower): album}
-album_lookup = {}
-# Normalized mapping {(normalized_artist, normalized_title): album}
-album_lookup_normalized = {}
+
+def json_loads(data):
+    """Decode JSON from ``str`` or ``bytes``."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
 
 # ---------------------------------------------------------------------------
-# Normalization Functions - Must be defined before use
+# Compression
 # ---------------------------------------------------------------------------
 
-def _strip_accents(value: str) -> str:
-    """Return a lowercase representation without accents."""
-    normalized = unicodedata.normalize("NFKD", value)
-    return "".join(ch for ch in normalized if not unicodedata.combining(ch))
+# Serve gzip/brotli feed variants, compressed once per render.
+FEED_COMPRESSION = os.getenv("FEED_COMPRESSION", "1") == "1"
+# Feeds smaller than this (bytes) are always sent uncompressed.
+FEED_COMPRESS_MIN_SIZE = int(os.getenv("FEED_COMPRESS_MIN_SIZE", "512"))
+# Brotli needs the optional ``brotli`` package.
+BROTLI_AVAILABLE = importlib.util.find_spec("brotli") is not None
+if BROTLI_AVAILABLE:
+    import brotli
+
+# Compress Redis values of at least REDIS_COMPRESS_MIN_SIZE bytes. Readers
+# always understand compressed values, so this can be switched on at any time.
+REDIS_COMPRESS = os.getenv("REDIS_COMPRESS", "0") == "1"
+REDIS_COMPRESS_MIN_SIZE = int(os.getenv("REDIS_COMPRESS_MIN_SIZE", "1024"))
+# Marks a zlib-compressed, base64-encoded value (valid JSON never starts so).
+COMPRESSED_PREFIX = "z:"
+
+
+def compress_feed(body: bytes) -> Dict[str, bytes]:
+    """Return the compressed variants of ``body`` worth sending, by encoding."""
+    if not FEED_COMPRESSION or len(body) < FEED_COMPRESS_MIN_SIZE:
+        return {}
+    variants = {"gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    if BROTLI_AVAILABLE:
+        variants["br"] = brotli.compress(body, mode=brotli.MODE_TEXT)
+    return {name: data for name, data in variants.items() if len(data) < len(body)}
+
+
+def negotiate_encoding(accept_encoding: str, available) -> Optional[str]:
+    """Pick the best of ``available`` for an Accept-Encoding header, or None."""
+    if not accept_encoding or not available:
+        return None
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name.strip().lower()] = q
+    # Brotli wins ties: it is smaller for JSON.
+    best, best_q = None, 0.0
+    for name in ("br", "gzip"):
+        q = weights.get(name, weights.get("*", 0.0))
+        if name in available and q > best_q:
+            best, best_q = name, q
+    return best
+
+
+def encode_cache_value(value) -> Tuple[str, int]:
+    """Serialize ``value`` for Redis; returns the text and the bytes saved."""
+    text = json_dumps(value)
+    if not REDIS_COMPRESS or len(text) < REDIS_COMPRESS_MIN_SIZE:
+        return text, 0
+    raw = text.encode("utf-8")
+    packed = COMPRESSED_PREFIX + base64.b64encode(zlib.compress(raw)).decode("ascii")
+    if len(packed) >= len(raw):
+        return text, 0
+    return packed, len(raw) - len(packed)
+
+
+def decode_cache_value(text: str):
+    if text.startswith(COMPRESSED_PREFIX):
+        return json_loads(zlib.decompress(base64.b64decode(text[len(COMPRESSED_PREFIX):])))
+    return json_loads(text)
 
+# ---------------------------------------------------------------------------
+# Shared HTTP clients
+# ---------------------------------------------------------------------------
 
-def _normalize_whitespace(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "10"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+# HTTP/2 needs the optional ``h2`` package (installed by ``httpx[http2]``).
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Per-upstream client settings: request timeout and whether to offer HTTP/2.
+HTTP_CLIENT_SETTINGS = {
+    "upstream": {
+        "timeout": float(os.getenv("UPSTREAM_TIMEOUT", "5")),
+        "http2": os.getenv("UPSTREAM_HTTP2", "0") == "1",
+    },
+    "itunes": {
+        "timeout": float(os.getenv("ITUNES_TIMEOUT", "5")),
+        "http2": True,
+    },
+    "pagerduty": {
+        "timeout": float(os.getenv("PAGERDUTY_TIMEOUT", "5")),
+        "http2": True,
+    },
+}
+
+# App-wide clients {name: AsyncClient}, created in ``lifespan`` and closed on
+# shutdown. Tests can swap in clients built with ``httpx.MockTransport``.
+http_clients: Dict[str, httpx.AsyncClient] = {}
 
 
-def normalize_artist(artist: str) -> str:
-    artist = _strip_accents(artist).lower()
-    artist = artist.replace("&", " and ")
-    artist = re.sub(r"^the\s+", "", artist)
-    artist = re.sub(r"[^a-z0-9]+", " ", artist)
-    return _normalize_whitespace(artist)
+def create_http_client(name: str, transport: Optional[httpx.AsyncBaseTransport] = None) -> httpx.AsyncClient:
+    """Build a pooled client for one upstream host."""
+    settings = HTTP_CLIENT_SETTINGS[name]
+    return httpx.AsyncClient(
+        timeout=settings["timeout"],
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+        http2=settings["http2"] and HTTP2_AVAILABLE,
+        transport=transport,
+    )
+
 
+def get_http_client(name: str) -> httpx.AsyncClient:
+    """Return the shared client for ``name``, creating it if needed."""
+    client = http_clients.get(name)
+    if client is None or client.is_closed:
+        client = http_clients[name] = create_http_client(name)
+    return client
 
-def _remove_featured(text: str) -> str:
-    return re.sub(r"\b(feat\.?|ft\.?|featuring)\b.*", "", text, flags=re.IGNORECASE)
 
+async def close_http_clients():
+    for client in http_clients.values():
+        await client.aclose()
+    http_clients.clear()
 
-def normalize_title(title: str) -> str:
-    title = _strip_accents(title)
-    title = _remove_featured(title)
-    title = re.sub(r"[\(\[].*?[\)\]]", "", title)
-    title = re.sub(r"\s+[-–—]\s+.*", "", title)
-    title = re.sub(r"[^a-zA-Z0-9]+", " ", title)
-    return _normalize_whitespace(title.lower())
+# CSV file used for album lookup. Can be overridden with environment variable.
+ALBUM_LOOKUP_CSV = os.getenv("ALBUM_LOOKUP_CSV", "album_lookup.csv")
+# Compiled snapshot of the CSV built with ``python album_index.py``.
+ALBUM_LOOKUP_INDEX = os.getenv("ALBUM_LOOKUP_INDEX", os.path.splitext(ALBUM_LOOKUP_CSV)[0] + ".idx")
 
+# In-memory mapping {(artist_lower, title_lower): album}
+album_lookup = {}
+# Normalized mapping {(normalized_artist, normalized_title): album}
+album_lookup_normalized = {}
+# Approximate-match index over the normalized keys (None when disabled)
+album_lookup_fuzzy = None
 
-def normalize_album(album: str) -> str:
-    album = _strip_accents(album).lower()
-    album = album.replace("&", " and ")
-    album = re.sub(r"[^a-z0-9]+", " ", album)
-    return _normalize_whitespace(album)
+# Resolve near-miss artist/title spellings against the CSV. Off by default:
+# a false match shows another album and its cover, and the false-match rate
+# has only been measured on perturbed CSV rows, not on replayed tracks.
+ALBUM_FUZZY_MATCH = os.getenv("ALBUM_FUZZY_MATCH", "0") == "1"
+# Minimum similarity (0-1) of both artist and title for a fuzzy match.
+ALBUM_FUZZY_THRESHOLD = float(os.getenv("ALBUM_FUZZY_THRESHOLD", "0.85"))
 
 # ---------------------------------------------------------------------------
 # Manual podcast metadata overrides.
@@ -201,17 +349,199 @@ def _resolve_podcast_key(title: str) -> Optional[str]:
     return PODCAST_TITLE_ALIASES.get(norm_title)
 
 
+# ---------------------------------------------------------------------------
+# iTunes rate limiting and circuit breaker
+# ---------------------------------------------------------------------------
+
+# iTunes throttles at roughly 20 calls/minute per IP, shared by all workers.
+ITUNES_RATE_LIMIT = float(os.getenv("ITUNES_RATE_LIMIT", "20"))  # per minute
+ITUNES_RATE_BURST = int(os.getenv("ITUNES_RATE_BURST", "5"))
+ITUNES_BREAKER_THRESHOLD = int(os.getenv("ITUNES_BREAKER_THRESHOLD", "5"))
+ITUNES_BREAKER_RESET = float(os.getenv("ITUNES_BREAKER_RESET", "60"))
+# Tokens a parallel search must leave in the bucket before it may run its
+# lower-priority queries alongside the first one.
+ITUNES_FANOUT_RESERVE = int(os.getenv("ITUNES_FANOUT_RESERVE", "2"))
+
+# Refill the bucket from Redis' clock and take one token if available, plus
+# up to ARGV[3] - 1 more as long as ARGV[4] tokens stay in the bucket.
+TOKEN_BUCKET_LUA = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local want = tonumber(ARGV[3])
+local reserve = tonumber(ARGV[4])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local granted = 0
+if tokens >= 1 then
+  granted = 1 + math.max(0, math.min(want - 1, math.floor(tokens - 1 - reserve)))
+  tokens = tokens - granted
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return granted
+"""
+
+
+class ITunesSkipped(Exception):
+    """An iTunes call was not made because of the breaker or rate limiter.
+
+    Unlike a search without a match this says nothing about the track, so
+    callers must not count it as a failed lookup.
+    """
+
+
+class RateLimiter:
+    """Token bucket shared across workers through Redis.
+
+    Falls back to an in-process bucket when Redis is unavailable.
+    """
+
+    def __init__(self, key: str, per_minute: float, burst: int):
+        self.key = key
+        self.rate = per_minute / 60
+        self.capacity = burst
+        self.denied = 0
+        self._tokens = float(burst)
+        self._ts = time.monotonic()
+        self._script = None
+
+    def _acquire_local(self, want: int, reserve: int) -> int:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._ts) * self.rate)
+        self._ts = now
+        if self._tokens < 1:
+            return 0
+        granted = 1 + max(0, min(want - 1, int(self._tokens - 1 - reserve)))
+        self._tokens -= granted
+        return granted
+
+    async def acquire(self, want: int = 1, reserve: int = 0) -> int:
+        """Take one token, plus up to ``want - 1`` spare ones.
+
+        Extra tokens are only handed out while ``reserve`` tokens remain in
+        the bucket afterwards. Returns the number taken; 0 means denied.
+        """
+        granted = None
+        if rdb_available:
+            try:
+                if self._script is None:
+                    self._script = rdb.register_script(TOKEN_BUCKET_LUA)
+                granted = int(await self._script(keys=[self.key], args=[self.rate, self.capacity, want, reserve]))
+            except Exception as e:
+                logging.debug(f"Redis rate limiter unavailable, using local bucket: {e}")
+        if granted is None:
+            granted = self._acquire_local(want, reserve)
+        if not granted:
+            self.denied += 1
+        return granted
+
+
+class CircuitBreaker:
+    """Stop calling a failing upstream until ``reset_timeout`` has passed.
+
+    After the timeout one probe request is let through (half-open); its
+    outcome closes the breaker again or re-opens it.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+
+    def _set_state(self, state: str):
+        if state == self.state:
+            return
+        logging.warning(f"{self.name} circuit breaker {self.state} -> {state}")
+        self.state = state
+        if rdb_available:
+            spawn_background(self._record_state())
+
+    async def _record_state(self):
+        try:
+            await rdb.hset(f"breaker:{self.name}", mapping={
+                "state": self.state,
+                "failures": self.failures,
+                "since": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "worker": WORKER_ID,
+            })
+        except Exception:
+            pass
+
+    def allow(self) -> bool:
+        if self.state == "open":
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self._set_state("half_open")
+        if self.state == "half_open":
+            if self._probing:
+                return False
+            self._probing = True
+        return True
+
+    def release(self):
+        """Give back a half-open probe slot that was not used."""
+        self._probing = False
+
+    def record_success(self):
+        self.failures = 0
+        self._probing = False
+        self._set_state("closed")
+
+    def record_failure(self):
+        self.failures += 1
+        self._probing = False
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            self._set_state("open")
+
+
+itunes_rate_limiter = RateLimiter("ratelimit:itunes", ITUNES_RATE_LIMIT, ITUNES_RATE_BURST)
+itunes_breaker = CircuitBreaker("itunes", ITUNES_BREAKER_THRESHOLD, ITUNES_BREAKER_RESET)
+
+
+async def itunes_get(client: httpx.AsyncClient, url: str, params, token: bool = False) -> Optional[httpx.Response]:
+    """GET an iTunes endpoint through the breaker and rate limiter.
+
+    Returns ``None`` when the request failed and raises ``ITunesSkipped``
+    when the breaker or rate limiter did not let it through. ``token`` means
+    the caller already took a rate limiter token for this call.
+    """
+    if not itunes_breaker.allow():
+        raise ITunesSkipped("iTunes circuit breaker open")
+    if not token and not await itunes_rate_limiter.acquire():
+        itunes_breaker.release()
+        logging.debug(f"iTunes rate limit reached, skipping {url} {params}")
+        raise ITunesSkipped("iTunes rate limit reached")
+    try:
+        resp = await client.get(url, params=params)
+        resp.raise_for_status()
+    except asyncio.CancelledError:
+        itunes_breaker.release()
+        raise
+    except Exception as exc:
+        itunes_breaker.record_failure()
+        logging.debug(f"iTunes request failed for {params}: {exc}")
+        return None
+    itunes_breaker.record_success()
+    return resp
+
+
 async def _lookup_itunes_collection_by_id(collection_id: int) -> Optional[Dict[str, str]]:
     """Fetch metadata for a specific iTunes collection identifier."""
-    async with httpx.AsyncClient(timeout=5) as client:
-        try:
-            resp = await client.get("https://itunes.apple.com/lookup", params={"id": collection_id})
-            resp.raise_for_status()
-        except Exception as exc:
-            logging.debug(f"iTunes lookup failed for collection {collection_id}: {exc}")
-            return None
+    client = get_http_client("itunes")
+    resp = await itunes_get(client, "https://itunes.apple.com/lookup", {"id": collection_id})
+    if resp is None:
+        return None
 
-    data = resp.json()
+    data = json_loads(resp.content)
     results = data.get("results", [])
     if not results:
         return None
@@ -255,7 +585,7 @@ rdb_available = True
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events."""
-    global rdb, rdb_available
+    global rdb, rdb_available, artwork_queue, sacad_pool
     # Startup
     try:
         await rdb.ping()
@@ -264,12 +594,47 @@ async def lifespan(app: FastAPI):
         logging.warning(f"Redis unavailable: {e}. Running without cache/metrics.")
         rdb = None
         rdb_available = False
+    for name in HTTP_CLIENT_SETTINGS:
+        get_http_client(name)
+    sacad_pool = create_sacad_pool()
     # Load CSV after Redis check so we don't block startup
     load_album_lookup(ALBUM_LOOKUP_CSV)
+    # Pre-render every feed in the background so requests only read memory
+    poller_tasks = [
+        asyncio.create_task(poll_feed(name, url))
+        for name, url in FEED_SOURCES.items()
+    ]
+    metrics_task = asyncio.create_task(metrics_buffer.run(METRICS_FLUSH_INTERVAL_MS / 1000))
+    if rdb_available:
+        poller_tasks.append(asyncio.create_task(listen_invalidations()))
+        poller_tasks.append(asyncio.create_task(rollup_unique_listeners()))
+        poller_tasks.append(asyncio.create_task(track_cache_size()))
+    if HEALTH_PROBE_INTERVAL > 0:
+        poller_tasks.append(asyncio.create_task(probe_feed_health()))
+    if ALBUM_LOOKUP_POLL_INTERVAL > 0:
+        poller_tasks.append(asyncio.create_task(watch_album_lookup()))
+    if ARTWORK_ASYNC:
+        artwork_queue = asyncio.Queue(maxsize=ARTWORK_QUEUE_SIZE)
+        poller_tasks.extend(asyncio.create_task(artwork_worker()) for _ in range(ARTWORK_WORKERS))
 
     yield
 
     # Shutdown
+    feed_broadcaster.close()
+    for task in poller_tasks:
+        task.cancel()
+    await asyncio.gather(*poller_tasks, return_exceptions=True)
+    # Stop the flush loop without cancelling a flush that is in flight; only
+    # cancel it if Redis hangs, which puts the batch back for the final flush.
+    metrics_buffer.stop()
+    try:
+        await asyncio.wait_for(metrics_task, timeout=5)
+    except Exception:
+        pass
+    await metrics_buffer.flush()
+    await close_http_clients()
+    await sacad_pool.close()
+    sacad_pool = None
     if rdb_available and rdb:
         await rdb.close()
         logging.info("Redis connection closed")
@@ -288,34 +653,41 @@ app.add_middleware(
     allow_credentials=True
 )
 
-def load_album_lookup(path: str):
-    """Load CSV mapping of artist+title to album."""
-    global album_lookup, album_lookup_normalized
+def _read_album_lookup(path: str):
+    """Return ``(direct, normalized)`` album mappings for ``path``.
+
+    A fresh compiled snapshot (see ``album_index.py``) is memory-mapped
+    instead of parsing the CSV.
+    """
+    index = album_index.open_index(ALBUM_LOOKUP_INDEX, path)
+    if index is not None:
+        logging.info(f"Loaded {len(index.direct)} album entries from snapshot {ALBUM_LOOKUP_INDEX}")
+        return index.direct, index.normalized
     if not os.path.exists(path):
         logging.warning(f"Album lookup CSV not found at {path}")
-        album_lookup = {}
-        album_lookup_normalized = {}
-        return
+        return {}, {}
     try:
-        with open(path, newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            album_lookup = {}
-            album_lookup_normalized = {}
-            for row in reader:
-                title = row.get('title', '').strip().lower()
-                artist = row.get('artist', '').strip().lower()
-                album = row.get('album', '').strip()
-                if title and artist and album:
-                    album_lookup[(artist, title)] = album
-                    norm_artist = normalize_artist(row.get('artist', ''))
-                    norm_title = normalize_title(row.get('title', ''))
-                    if norm_artist and norm_title:
-                        album_lookup_normalized[(norm_artist, norm_title)] = album
-        logging.info(f"Loaded {len(album_lookup)} album entries from {path}")
+        direct, normalized = album_index.read_csv(path)
+        logging.info(f"Loaded {len(direct)} album entries from {path}")
+        return direct, normalized
     except Exception as e:
         logging.error(f"Failed to load album lookup CSV: {e}")
-        album_lookup = {}
-        album_lookup_normalized = {}
+        return {}, {}
+
+def _build_fuzzy_index(normalized):
+    if not ALBUM_FUZZY_MATCH:
+        return None
+    start = time.perf_counter()
+    index = FuzzyIndex(normalized.items(), threshold=ALBUM_FUZZY_THRESHOLD)
+    logging.info(f"Built fuzzy album index over {len(index)} entries in {(time.perf_counter() - start) * 1000:.0f} ms")
+    return index
+
+def load_album_lookup(path: str):
+    """Load CSV mapping of artist+title to album."""
+    global album_lookup, album_lookup_normalized, album_lookup_fuzzy, _album_lookup_stat
+    _album_lookup_stat = _album_lookup_signature(path)
+    album_lookup, album_lookup_normalized = _read_album_lookup(path)
+    album_lookup_fuzzy = _build_fuzzy_index(album_lookup_normalized)
 
 def get_csv_album(artist: str, title: str) -> str:
     """Return album from lookup CSV if present."""
@@ -344,9 +716,123 @@ def get_csv_album(artist: str, title: str) -> str:
     if normalized:
         return normalized
 
+    # Finally accept a close spelling of the normalized key
+    if album_lookup_fuzzy is not None:
+        return album_lookup_fuzzy.lookup(norm_artist, norm_title) or ''
+
     return ''
 
 
+# ---------------------------------------------------------------------------
+# Album lookup hot reload
+# ---------------------------------------------------------------------------
+
+# Seconds between checks of the CSV/snapshot for changes; 0 disables.
+ALBUM_LOOKUP_POLL_INTERVAL = float(os.getenv("ALBUM_LOOKUP_POLL_INTERVAL", "30"))
+# Workers announce a reload here so the others pick it up immediately.
+ALBUM_RELOAD_CHANNEL = "album_lookup:reload"
+
+# (mtime_ns, size) of the CSV and snapshot at the last load.
+_album_lookup_stat = None
+_album_reload_lock = asyncio.Lock()
+
+
+def _album_lookup_signature(path: str):
+    signature = []
+    for p in (path, ALBUM_LOOKUP_INDEX):
+        try:
+            st = os.stat(p)
+            signature.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def _load_and_diff(path: str, old_direct):
+    """Load the lookup tables and list rows whose album changed.
+
+    Runs in a worker thread. Returns ``(direct, normalized, fuzzy, changes)`` where
+    ``changes`` holds ``(artist, title, old_album, new_album)`` tuples.
+    """
+    direct, normalized = _read_album_lookup(path)
+    old = dict(old_direct.items())
+    new = dict(direct.items())
+    changes = [
+        (artist, title, old.get((artist, title)), new.get((artist, title)))
+        for artist, title in old.keys() | new.keys()
+        if old.get((artist, title)) != new.get((artist, title))
+    ]
+    return direct, normalized, _build_fuzzy_index(normalized), changes
+
+
+async def _invalidate_album_covers(changes):
+    """Drop cached artwork for tracks whose CSV album changed.
+
+    Only the keys of the old and new CSV albums are dropped. Without a CSV
+    row a track is keyed by its TALB tag or title, which the CSV does not
+    know; those entries are left to expire.
+    """
+    keys = set()
+    for artist, title, old_album, new_album in changes:
+        for album in (old_album, new_album):
+            if album:
+                keys.update(cover_cache_keys(artist, album))
+    for key in keys:
+        cover_l1.delete(key)
+    if not keys or not rdb_available:
+        return
+    try:
+        pipe = rdb.pipeline(transaction=False)
+        pipe.delete(*keys)
+        _publish_invalidation(pipe, sorted(k for k in keys if k.startswith("cover:")))
+        await pipe.execute()
+    except Exception as e:
+        logging.warning(f"Failed to invalidate covers after album lookup reload: {e}")
+
+
+async def reload_album_lookup(notify: bool = True):
+    """Reload the album lookup off the event loop and swap it in atomically.
+
+    With ``notify`` the covers of changed rows are invalidated and the other
+    workers are told to reload too.
+    """
+    global album_lookup, album_lookup_normalized, album_lookup_fuzzy, _album_lookup_stat
+    async with _album_reload_lock:
+        signature = _album_lookup_signature(ALBUM_LOOKUP_CSV)
+        direct, normalized, fuzzy, changes = await asyncio.to_thread(
+            _load_and_diff, ALBUM_LOOKUP_CSV, album_lookup
+        )
+        album_lookup, album_lookup_normalized, album_lookup_fuzzy = direct, normalized, fuzzy
+        _album_lookup_stat = signature
+        logging.info(f"Album lookup reloaded: {len(changes)} changed rows")
+        if not changes:
+            return
+        # Re-render on the next poll so feeds pick up the new albums.
+        spec_item_cache.clear()
+        for rendered in rendered_feeds.values():
+            rendered.rendered_at = 0.0
+        if notify:
+            await _invalidate_album_covers(changes)
+            if rdb_available:
+                try:
+                    await rdb.publish(ALBUM_RELOAD_CHANNEL, json_dumps({"origin": WORKER_ID}))
+                except Exception:
+                    pass
+
+
+async def watch_album_lookup():
+    """Reload the album lookup whenever the CSV or snapshot changes on disk."""
+    while True:
+        await asyncio.sleep(ALBUM_LOOKUP_POLL_INTERVAL)
+        try:
+            if _album_lookup_signature(ALBUM_LOOKUP_CSV) != _album_lookup_stat:
+                await reload_album_lookup()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logging.error(f"[ERROR] Album lookup reload failed: {e}")
+
+
 def _looks_like_podcast(artist: str, title: str) -> bool:
     """Heuristic to detect teaching segments that are likely podcasts."""
     text = f"{artist} {title}".lower()
@@ -376,28 +862,44 @@ def _upgrade_artwork_url(url: str) -> str:
     return upgraded
 
 
+# Run all iTunes search strategies for a track concurrently instead of one
+# after another.
+ITUNES_PARALLEL_SEARCH = os.getenv("ITUNES_PARALLEL_SEARCH", "1") == "1"
+
+
+async def _itunes_search(client: httpx.AsyncClient, params: Dict[str, str], token: bool = False) -> list:
+    """Run one iTunes search query and return its raw results."""
+    with timed(f"itunes.{params.get('entity', 'search')}"):
+        resp = await itunes_get(client, "https://itunes.apple.com/search", {**params, "limit": 5}, token=token)
+    if resp is None:
+        return []
+    return json_loads(resp.content).get("results", [])
+
+
 async def lookup_itunes_metadata(artist: str, title: str, album: Optional[str] = None) -> Optional[Dict[str, str]]:
     """Query the iTunes Search API for artwork and metadata."""
 
+    # Normalize the query once rather than for every candidate result.
+    norm_artist = normalize_artist(artist) if artist else ""
+    norm_title = normalize_title(title) if title else ""
+    album_norm = normalize_album(album) if album else ""
+
     def matches_artist(candidate: str) -> bool:
         if not artist:
             return True
         norm_candidate = normalize_artist(candidate)
-        norm_artist = normalize_artist(artist)
         return norm_candidate == norm_artist or norm_artist in norm_candidate or norm_candidate in norm_artist
 
     def matches_title(candidate: str) -> bool:
         if not title:
             return True
         norm_candidate = normalize_title(candidate)
-        norm_title = normalize_title(title)
         return norm_candidate == norm_title or norm_title in norm_candidate or norm_candidate in norm_title
 
     def matches_album(candidate: str) -> bool:
         if not album:
             return True
         candidate_norm = normalize_album(candidate)
-        album_norm = normalize_album(album)
         return candidate_norm == album_norm or album_norm in candidate_norm
 
     search_params = []
@@ -411,58 +913,74 @@ async def lookup_itunes_metadata(artist: str, title: str, album: Optional[str] =
     if _looks_like_podcast(artist, title):
         search_params.append({"term": f"{artist} {title}".strip(), "media": "podcast", "entity": "podcast"})
 
-    async with httpx.AsyncClient(timeout=5) as client:
-        for params in search_params:
-            term = params.get("term", "").strip()
-            if not term:
-                continue
-            try:
-                resp = await client.get(
-                    "https://itunes.apple.com/search",
-                    params={**params, "limit": 5},
-                )
-                resp.raise_for_status()
-            except Exception as exc:
-                logging.debug(f"iTunes search failed for {params}: {exc}")
-                continue
+    def match_result(params, result) -> Optional[Dict[str, str]]:
+        result_artist = result.get("artistName", "")
+        result_title = result.get("trackName") or result.get("collectionName", "")
+        result_album = result.get("collectionName", "")
+
+        if params.get("entity") == "album":
+            if matches_artist(result_artist) and matches_album(result_album):
+                artwork = _upgrade_artwork_url(result.get("artworkUrl100") or result.get("artworkUrl60", ""))
+                if not artwork:
+                    return None
+                return {
+                    "imageUrl": artwork,
+                    "itunesTrackUrl": result.get("collectionViewUrl", ""),
+                    "previewUrl": result.get("previewUrl", ""),
+                }
+        elif params.get("entity") == "podcast":
+            artwork = _upgrade_artwork_url(result.get("artworkUrl100") or result.get("artworkUrl60", ""))
+            if not artwork:
+                return None
+            if matches_artist(result_artist) or matches_title(result_title):
+                return {
+                    "imageUrl": artwork,
+                    "itunesTrackUrl": result.get("collectionViewUrl", ""),
+                    "previewUrl": result.get("feedUrl", ""),
+                }
+        else:
+            if matches_artist(result_artist) and matches_title(result_title):
+                artwork = result.get("artworkUrl100") or result.get("artworkUrl60", "")
+                artwork = _upgrade_artwork_url(artwork)
+                if not artwork:
+                    return None
+                return {
+                    "imageUrl": artwork,
+                    "itunesTrackUrl": result.get("trackViewUrl", ""),
+                    "previewUrl": result.get("previewUrl", ""),
+                }
+        return None
 
-            data = resp.json()
-            for result in data.get("results", []):
-                result_artist = result.get("artistName", "")
-                result_title = result.get("trackName") or result.get("collectionName", "")
-                result_album = result.get("collectionName", "")
-
-                if params.get("entity") == "album":
-                    if matches_artist(result_artist) and matches_album(result_album):
-                        artwork = _upgrade_artwork_url(result.get("artworkUrl100") or result.get("artworkUrl60", ""))
-                        if not artwork:
-                            continue
-                        return {
-                            "imageUrl": artwork,
-                            "itunesTrackUrl": result.get("collectionViewUrl", ""),
-                            "previewUrl": result.get("previewUrl", ""),
-                        }
-                elif params.get("entity") == "podcast":
-                    artwork = _upgrade_artwork_url(result.get("artworkUrl100") or result.get("artworkUrl60", ""))
-                    if not artwork:
-                        continue
-                    if matches_artist(result_artist) or matches_title(result_title):
-                        return {
-                            "imageUrl": artwork,
-                            "itunesTrackUrl": result.get("collectionViewUrl", ""),
-                            "previewUrl": result.get("feedUrl", ""),
-                        }
-                else:
-                    if matches_artist(result_artist) and matches_title(result_title):
-                        artwork = result.get("artworkUrl100") or result.get("artworkUrl60", "")
-                        artwork = _upgrade_artwork_url(artwork)
-                        if not artwork:
-                            continue
-                        return {
-                            "imageUrl": artwork,
-                            "itunesTrackUrl": result.get("trackViewUrl", ""),
-                            "previewUrl": result.get("previewUrl", ""),
-                        }
+    search_params = [p for p in search_params if p.get("term", "").strip()]
+    client = get_http_client("itunes")
+    tasks = []
+    if ITUNES_PARALLEL_SEARCH and len(search_params) > 1:
+        # Every launched query spends a token even when a higher-priority one
+        # matches, so only fan out with tokens to spare; queries without a
+        # pre-taken token run one after another as in the sequential search.
+        granted = await itunes_rate_limiter.acquire(len(search_params), reserve=ITUNES_FANOUT_RESERVE)
+        if not granted:
+            raise ITunesSkipped("iTunes rate limit reached")
+        tasks = [
+            asyncio.ensure_future(_itunes_search(client, params, token=True))
+            for params in search_params[:granted]
+        ]
+    try:
+        # Results are checked in the original priority order, so the match is
+        # the same one the sequential search would return; the lower-priority
+        # queries have simply been running in the meantime.
+        for i, params in enumerate(search_params):
+            results = await tasks[i] if i < len(tasks) else await _itunes_search(client, params)
+            for result in results:
+                match = match_result(params, result)
+                if match:
+                    return match
+    finally:
+        for task in tasks:
+            # Lower-priority queries may still end with ITunesSkipped; mark
+            # their outcome as retrieved so asyncio does not log it.
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            task.cancel()
     return None
 
 # Default fallback image for when no artwork is found
@@ -492,12 +1010,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 </head>
 <body>
   <h1>Family Radio JSON Feeds</h1>
-  <a class="button" href="/east-feed.json" target="_blank">East Feed (WFME)</a>
-  <a class="button" href="/west-feed.json" target="_blank">West Feed (KEAR)</a>
-  <a class="button" href="/worship-feed.json" target="_blank">Worship Feed</a>
-  <a class="button" href="/fourth-feed.json" target="_blank">Everlight Hymns</a>
-  <a class="button" href="/fifth-feed.json" target="_blank">FR Foundations</a>
-  <a class="button" href="/sixth-feed.json" target="_blank">Christmas</a>
+  <!-- FEED_LINKS -->
   <br><br>
   <a class="button admin-button" href="/admin/dashboard" target="_blank">📊 Admin Dashboard</a>
   <form action="/admin/test-alert" method="get" target="_blank" style="margin-top: 2rem;">
@@ -506,16 +1019,71 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 </body>
 </html>"""
 
-SOURCE_EAST   = "https://yp.cdnstream1.com/metadata/2632_128/last/12.json"
-SOURCE_WEST   = "https://yp.cdnstream1.com/metadata/2638_128/last/12.json"
-SOURCE_THIRD  = "https://yp.cdnstream1.com/metadata/2878_128/last/12.json"
-SOURCE_FOURTH = "https://yp.cdnstream1.com/metadata/10484_128/last/12.json"  # Everlight Hymns
-SOURCE_FIFTH  = "https://yp.cdnstream1.com/metadata/10483_128/last/12.json"  # FR Foundations
-SOURCE_SIXTH  = "https://yp.cdnstream1.com/metadata/5432_128/last/12.json"   # Christmas
+# Feed registry file (JSON, or YAML when PyYAML is installed); see feeds.json.
+FEED_REGISTRY = feed_registry.default_path()
+
+# Defaults for feeds that do not set their own values in the registry.
+# How often (seconds) each feed is polled and re-rendered when it changed.
+FEED_POLL_INTERVAL = float(os.getenv("FEED_POLL_INTERVAL", "10"))
+# Artwork lookups a single feed's render may run at once.
+FEED_CONCURRENCY = int(os.getenv("FEED_CONCURRENCY", "4"))
+# Re-render an unchanged feed after this many seconds so artwork that was
+# missing (fallback image) gets another chance once the cover cache expires.
+FEED_RENDER_MAX_AGE = float(os.getenv("FEED_RENDER_MAX_AGE", "300"))
+# Seconds browsers and CDNs may reuse a feed response; 0 makes them
+# revalidate every time (cheap thanks to ETag/304).
+FEED_CACHE_MAX_AGE = int(os.getenv("FEED_CACHE_MAX_AGE", "5"))
+
+# Stale-while-revalidate: entries older than the soft TTL are still served but
+# refreshed in the background; Redis drops them once the hard TTL passes.
+SWR_ENABLED = os.getenv("SWR_ENABLED", "1") == "1"
+FEED_SOFT_TTL = int(os.getenv("FEED_SOFT_TTL", "30"))
+FEED_HARD_TTL = int(os.getenv("FEED_HARD_TTL", "3600"))
+COVER_SOFT_TTL = int(os.getenv("COVER_SOFT_TTL", "300"))
+COVER_HARD_TTL = int(os.getenv("COVER_HARD_TTL", "86400"))
+
+# Feed name -> FeedConfig, in registry order.
+FEEDS = feed_registry.load_feeds(FEED_REGISTRY, {
+    "poll_interval": FEED_POLL_INTERVAL,
+    "soft_ttl": FEED_SOFT_TTL,
+    "hard_ttl": FEED_HARD_TTL,
+    "concurrency": FEED_CONCURRENCY,
+})
+
+# Feed name -> upstream source. Used by the background poller.
+FEED_SOURCES = {name: feed.source for name, feed in FEEDS.items()}
+
+# Per-feed TTLs from the registry; environment overrides such as
+# FEED_SOFT_TTL_EAST=15 or FEED_HARD_TTL_SIXTH=600 still win.
+FEED_TTLS = {
+    name: (
+        int(os.getenv(f"FEED_SOFT_TTL_{name.upper()}", feed.soft_ttl)),
+        int(os.getenv(f"FEED_HARD_TTL_{name.upper()}", feed.hard_ttl)),
+    )
+    for name, feed in FEEDS.items()
+}
+
+# Bounds the artwork lookups each feed runs at once so one busy stream
+# cannot starve the others.
+feed_semaphores = {name: asyncio.Semaphore(feed.concurrency) for name, feed in FEEDS.items()}
+
+HOMEPAGE_HTML = HTML_TEMPLATE.replace("  <!-- FEED_LINKS -->\n", "".join(
+    f'  <a class="button" href="/{name}-feed.json" target="_blank">{html.escape(feed.label)}</a>\n'
+    for name, feed in FEEDS.items()
+))
 
 def hash_key(artist: str, title: str) -> str:
     return hashlib.sha1(f"{artist.lower()}|{title.lower()}".encode()).hexdigest()
 
+def cover_cache_keys(artist: str, album: str, title: Optional[str] = None) -> Tuple[str, str]:
+    """Return the ``cover:`` and ``fail:`` keys for a track's artwork.
+
+    ``album`` is the CSV album, else the track's TALB tag; tracks with
+    neither are keyed by ``title``.
+    """
+    hashed = hash_key(artist, album or title or "")
+    return f"cover:{hashed}", f"fail:{hashed}"
+
 def get_metrics_keys(feed):
     now = datetime.now()
     return {
@@ -527,185 +1095,1107 @@ def get_metrics_keys(feed):
         "year": f"metrics:{feed}:year:{now.strftime('%Y')}",
     }
 
-def get_unique_keys(feed):
-    now = datetime.now()
+# ---------------------------------------------------------------------------
+# Unique listeners (HyperLogLog)
+# ---------------------------------------------------------------------------
+
+# Hits are PFADDed to the minute, hour and day HLLs only. Week, month and
+# year HLLs are rollups merged from the daily ones by rollup_unique_listeners;
+# the dashboard adds today's HLL to them, so counts are current between runs.
+UNIQUE_HIT_PERIODS = ("minute", "hour", "day")
+UNIQUE_ROLLUP_INTERVAL = float(os.getenv("UNIQUE_ROLLUP_INTERVAL", "300"))
+UNIQUE_TTLS = {
+    "minute": 2 * 3600,
+    "hour": 2 * 86400,
+    "day": 8 * 86400,
+    "week": 15 * 86400,
+    "month": 400 * 86400,
+    "year": 800 * 86400,
+}
+
+
+def get_unique_keys(feed, now=None):
+    now = now or datetime.now()
     return {
-        "minute": f"unique:{feed}:min:{now.strftime('%Y-%m-%d-%H-%M')}",
-        "hour": f"unique:{feed}:hour:{now.strftime('%Y-%m-%d-%H')}",
-        "day": f"unique:{feed}:day:{now.strftime('%Y-%m-%d')}",
-        "week": f"unique:{feed}:week:{now.strftime('%Y-%U')}",
-        "month": f"unique:{feed}:month:{now.strftime('%Y-%m')}",
-        "year": f"unique:{feed}:year:{now.strftime('%Y')}",
+        "minute": f"hll:unique:{feed}:min:{now.strftime('%Y-%m-%d-%H-%M')}",
+        "hour": f"hll:unique:{feed}:hour:{now.strftime('%Y-%m-%d-%H')}",
+        "day": f"hll:unique:{feed}:day:{now.strftime('%Y-%m-%d')}",
+        "week": f"hll:unique:{feed}:week:{now.strftime('%Y-%U')}",
+        "month": f"hll:unique:{feed}:month:{now.strftime('%Y-%m')}",
+        "year": f"hll:unique:{feed}:year:{now.strftime('%Y')}",
     }
 
-async def increment_metrics(feed, client_id):
+
+async def rollup_unique_listeners():
+    """Merge daily unique-listener HLLs into the week/month/year rollups.
+
+    Yesterday is merged again so hits from just before midnight land in the
+    previous day's rollups. Only one worker per interval does the work.
+    """
+    while True:
+        await asyncio.sleep(UNIQUE_ROLLUP_INTERVAL)
+        try:
+            if not await rdb.set("hll:unique:rollup_lock", WORKER_ID, nx=True, ex=max(1, int(UNIQUE_ROLLUP_INTERVAL))):
+                continue
+            now = datetime.now()
+            pipe = rdb.pipeline(transaction=False)
+            for feed in FEEDS:
+                for moment in (now - timedelta(days=1), now):
+                    keys = get_unique_keys(feed, moment)
+                    for period in ("week", "month"):
+                        pipe.pfmerge(keys[period], keys["day"])
+                        pipe.expire(keys[period], UNIQUE_TTLS[period])
+                    pipe.pfmerge(keys["year"], keys["month"])
+                    pipe.expire(keys["year"], UNIQUE_TTLS["year"])
+            await pipe.execute()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logging.warning(f"Unique listener rollup failed: {e}")
+
+# ---------------------------------------------------------------------------
+# Buffered metrics writer
+# ---------------------------------------------------------------------------
+
+# Counters and unique-listener IDs are accumulated in memory and written to
+# Redis in one pipeline every METRICS_FLUSH_INTERVAL_MS milliseconds, or
+# sooner once METRICS_FLUSH_EVENTS updates are pending. Request handlers only
+# touch dicts; a slow Redis delays the dashboard, not listeners.
+METRICS_FLUSH_INTERVAL_MS = int(os.getenv("METRICS_FLUSH_INTERVAL_MS", "1000"))
+METRICS_FLUSH_EVENTS = int(os.getenv("METRICS_FLUSH_EVENTS", "1000"))
+METRICS_BUFFER_MAX = int(os.getenv("METRICS_BUFFER_MAX", "50000"))
+# Longest wait between retries while flushes keep failing.
+METRICS_FLUSH_BACKOFF_MAX_MS = int(os.getenv("METRICS_FLUSH_BACKOFF_MAX_MS", "30000"))
+
+
+class MetricsBuffer:
+    """Aggregate counter increments and HLL members between Redis flushes.
+
+    Each counter key, hash field and unique ID takes one slot however many
+    hits it gets. Once ``max_pending`` slots are buffered (e.g. while Redis
+    is down), updates that need a new slot are dropped and counted in
+    ``dropped``; existing slots keep counting.
+    """
+
+    def __init__(self, flush_events: int, max_pending: int):
+        self.flush_events = flush_events
+        self.max_pending = max_pending
+        self.dropped = 0
+        self.flushed = 0
+        # Consecutive failed flushes; retries back off while this is set.
+        self.failures = 0
+        self._counters: Dict[str, int] = {}
+        self._hash_counters: Dict[Tuple[str, str], int] = {}
+        self._members: Dict[str, set] = {}
+        self._ttls: Dict[str, int] = {}
+        self._pending_members = 0
+        self._events = 0
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+
+    def __len__(self):
+        return len(self._counters) + len(self._hash_counters) + self._pending_members
+
+    def _full(self) -> bool:
+        if len(self) < self.max_pending:
+            return False
+        self.dropped += 1
+        return True
+
+    def incr(self, key: str, amount: int = 1):
+        self._add_counter(key, amount)
+        self._tick()
+
+    def _add_counter(self, key, amount):
+        if key in self._counters:
+            self._counters[key] += amount
+        elif not self._full():
+            self._counters[key] = amount
+
+    def hincr(self, key: str, field: str, amount: int = 1, ttl: Optional[int] = None):
+        self._add_hash_counter((key, field), amount, ttl)
+        self._tick()
+
+    def _add_hash_counter(self, slot, amount, ttl):
+        if slot in self._hash_counters:
+            self._hash_counters[slot] += amount
+        elif self._full():
+            return
+        else:
+            self._hash_counters[slot] = amount
+        if ttl:
+            self._ttls[slot[0]] = ttl
+
+    def pfadd(self, key: str, member: str, ttl: int):
+        self._add_member(key, member, ttl)
+        self._tick()
+
+    def _add_member(self, key, member, ttl):
+        members = self._members.get(key)
+        if members is not None and member in members:
+            return
+        if self._full():
+            return
+        if members is None:
+            members = self._members[key] = set()
+            self._ttls[key] = ttl
+        members.add(member)
+        self._pending_members += 1
+
+    def _tick(self):
+        self._events += 1
+        # While backing off, wait out the delay instead of flushing early.
+        if self._events >= self.flush_events and not self.failures:
+            self._wakeup.set()
+
+    async def flush(self):
+        """Write everything buffered so far in one pipeline."""
+        if not self._counters and not self._hash_counters and not self._members:
+            return
+        counters, hash_counters, members, ttls = self._counters, self._hash_counters, self._members, self._ttls
+        self._counters, self._hash_counters, self._members, self._ttls = {}, {}, {}, {}
+        self._pending_members = self._events = 0
+        self._wakeup.clear()
+        if not rdb_available:
+            return
+        try:
+            pipe = rdb.pipeline(transaction=False)
+            for key, amount in counters.items():
+                pipe.incrby(key, amount)
+            for (key, field), amount in hash_counters.items():
+                pipe.hincrby(key, field, amount)
+            for key in {key for key, _ in hash_counters if key in ttls}:
+                pipe.expire(key, ttls[key])
+            for key, ids in members.items():
+                pipe.pfadd(key, *ids)
+                pipe.expire(key, ttls[key])
+            await pipe.execute()
+            self.flushed += 1
+            self.failures = 0
+        except asyncio.CancelledError:
+            # Keep the batch for the final flush instead of dropping it.
+            self._restore(counters, hash_counters, members, ttls)
+            raise
+        except Exception as e:
+            self.failures += 1
+            logging.warning(f"Metrics flush failed ({self.failures} in a row), retrying with back-off: {e}")
+            self._restore(counters, hash_counters, members, ttls)
+
+    def _restore(self, counters, hash_counters, members, ttls):
+        # Merge without _tick(): a restored batch must not trigger a retry.
+        for key, amount in counters.items():
+            self._add_counter(key, amount)
+        for slot, amount in hash_counters.items():
+            self._add_hash_counter(slot, amount, ttls.get(slot[0]))
+        for key, ids in members.items():
+            for member in ids:
+                self._add_member(key, member, ttls[key])
+
+    def retry_delay(self, interval: float) -> float:
+        """Seconds until the next flush: ``interval``, doubled per failure."""
+        if not self.failures:
+            return interval
+        return min(interval * 2 ** min(self.failures, 16), max(interval, METRICS_FLUSH_BACKOFF_MAX_MS / 1000))
+
+    async def run(self, interval: float):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.retry_delay(interval))
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+    def stop(self):
+        """Let ``run`` finish its current flush and return."""
+        self._stopping = True
+        self._wakeup.set()
+
+
+metrics_buffer = MetricsBuffer(METRICS_FLUSH_EVENTS, METRICS_BUFFER_MAX)
+
+
+def increment_metrics(feed, client_id, bytes_saved=0):
     if not rdb_available:
         return
-    keys = get_metrics_keys(feed)
-    unique_keys = get_unique_keys(feed)
-    pipe = rdb.pipeline()
-    for k in keys.values():
-        pipe.incr(k)
-    for k in unique_keys.values():
-        pipe.sadd(k, client_id)
-        pipe.expire(k, 1209600)  # Keep unique sets for 14 days
-    await pipe.execute()
+    with timed("increment_metrics"):
+        for key in get_metrics_keys(feed).values():
+            metrics_buffer.incr(key)
+        unique_keys = get_unique_keys(feed)
+        for period in UNIQUE_HIT_PERIODS:
+            metrics_buffer.pfadd(unique_keys[period], client_id, UNIQUE_TTLS[period])
+        if bytes_saved:
+            metrics_buffer.incr("metrics:bytes_saved:response", bytes_saved)
 
-async def increment_cache_counter(cache_type: str, status: str):
+def increment_cache_counter(cache_type: str, status: str, amount: int = 1):
     if not rdb_available:
         return
-    key = f"metrics:cache:{cache_type}:{status}"
-    await rdb.incr(key)
+    metrics_buffer.incr(f"metrics:cache:{cache_type}:{status}", amount)
 
-async def fetch_tracks(source_url, ttl=30):
-    if not source_url:
-        logging.warning("Empty source URL provided to fetch_tracks")
-        return []
+# ---------------------------------------------------------------------------
+# Latency histograms
+# ---------------------------------------------------------------------------
 
-    key = f"feed:{source_url}"
+# Upper bounds in seconds, as in a Prometheus histogram; slower observations
+# land in a final +Inf bucket.
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# One hash holds every stage across workers, with fields "{stage}|{bucket}",
+# "{stage}|count" and "{stage}|sum_us"; bucket counts are not cumulative.
+# LATENCY_KEY is the lifetime total exported on /metrics; the same fields also
+# go to a per-minute "{LATENCY_KEY}:{epoch minute}" hash that expires, from
+# which the dashboard sums the last LATENCY_WINDOW_MINUTES.
+LATENCY_KEY = "metrics:latency"
+LATENCY_WINDOW_MINUTES = int(os.getenv("LATENCY_WINDOW_MINUTES", "15"))
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of one stage's durations in this worker."""
+
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> int:
+        bucket = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+        self.counts[bucket] += 1
+        self.count += 1
+        self.sum += seconds
+        return bucket
+
+    def quantile(self, q: float) -> float:
+        return histogram_quantile(q, self.counts)
+
+
+latency_histograms: Dict[str, LatencyHistogram] = {}
+# This worker's histograms per epoch minute, for the dashboard without Redis.
+latency_minutes: "OrderedDict[int, Dict[str, LatencyHistogram]]" = OrderedDict()
+
+
+def observe_latency(stage: str, seconds: float):
+    histogram = latency_histograms.get(stage)
+    if histogram is None:
+        histogram = latency_histograms[stage] = LatencyHistogram()
+    bucket = histogram.observe(seconds)
+    minute = int(time.time() // 60)
+    recent = latency_minutes.get(minute)
+    if recent is None:
+        recent = latency_minutes[minute] = {}
+        while len(latency_minutes) > LATENCY_WINDOW_MINUTES:
+            latency_minutes.popitem(last=False)
+    minute_histogram = recent.get(stage)
+    if minute_histogram is None:
+        minute_histogram = recent[stage] = LatencyHistogram()
+    minute_histogram.observe(seconds)
     if rdb_available:
+        sum_us = int(seconds * 1e6)
+        minute_key = f"{LATENCY_KEY}:{minute}"
+        ttl = (LATENCY_WINDOW_MINUTES + 2) * 60
+        for key in (LATENCY_KEY, minute_key):
+            metrics_buffer.hincr(key, f"{stage}|{bucket}", ttl=ttl if key is minute_key else None)
+            metrics_buffer.hincr(key, f"{stage}|count")
+            metrics_buffer.hincr(key, f"{stage}|sum_us", sum_us)
+
+
+def recent_latency_keys(now: Optional[float] = None):
+    """Per-minute latency hashes covering the last LATENCY_WINDOW_MINUTES."""
+    minute = int((now or time.time()) // 60)
+    return [f"{LATENCY_KEY}:{m}" for m in range(minute - LATENCY_WINDOW_MINUTES + 1, minute + 1)]
+
+
+def recent_latency(raws=None) -> Dict[str, LatencyHistogram]:
+    """Sum per-minute latency hashes, or this worker's recent minutes."""
+    if raws is not None and any(raws):
+        merged: Dict[str, int] = {}
+        for raw in raws:
+            for name, value in (raw or {}).items():
+                merged[name] = merged.get(name, 0) + int(value)
+        return latency_snapshot(merged)
+    oldest = int(time.time() // 60) - LATENCY_WINDOW_MINUTES + 1
+    histograms: Dict[str, LatencyHistogram] = {}
+    for minute, stages in latency_minutes.items():
+        if minute < oldest:
+            continue
+        for stage, histogram in stages.items():
+            total = histograms.get(stage)
+            if total is None:
+                total = histograms[stage] = LatencyHistogram()
+            total.counts = [a + b for a, b in zip(total.counts, histogram.counts)]
+            total.count += histogram.count
+            total.sum += histogram.sum
+    return dict(sorted(histograms.items()))
+
+
+def histogram_quantile(q: float, counts) -> float:
+    """Estimate the ``q`` quantile from per-bucket counts.
+
+    Interpolates linearly inside the bucket like Prometheus does; values in
+    the +Inf bucket are reported as the largest finite bound.
+    """
+    total = sum(counts)
+    if not total:
+        return 0.0
+    rank = q * total
+    seen = 0
+    for i, n in enumerate(counts):
+        if n and seen + n >= rank:
+            if i == len(LATENCY_BUCKETS):
+                return LATENCY_BUCKETS[-1]
+            lower = LATENCY_BUCKETS[i - 1] if i else 0.0
+            return lower + (LATENCY_BUCKETS[i] - lower) * (rank - seen) / n
+        seen += n
+    return LATENCY_BUCKETS[-1]
+
+
+class timed:
+    """Record how long a block or coroutine function takes under ``stage``.
+
+    Use as ``with timed("stage") as timer:`` (``timer.stage`` may be changed
+    inside the block to label the outcome) or as ``@timed("stage")`` on an
+    ``async def``.
+    """
+
+    __slots__ = ("stage", "start")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        observe_latency(self.stage, time.perf_counter() - self.start)
+        return False
+
+    def __call__(self, func):
+        stage = self.stage
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with timed(stage):
+                return await func(*args, **kwargs)
+        return wrapper
+
+
+def latency_snapshot(raw: Optional[Dict[str, str]] = None) -> Dict[str, LatencyHistogram]:
+    """Return per-stage histograms from a ``LATENCY_KEY`` hash, or this worker's."""
+    if not raw:
+        return dict(sorted(latency_histograms.items()))
+    histograms: Dict[str, LatencyHistogram] = {}
+    for name, value in raw.items():
+        stage, _, part = name.rpartition("|")
+        histogram = histograms.get(stage)
+        if histogram is None:
+            histogram = histograms[stage] = LatencyHistogram()
+        if part == "count":
+            histogram.count = int(value)
+        elif part == "sum_us":
+            histogram.sum = int(value) / 1e6
+        elif part.isdigit() and int(part) < len(histogram.counts):
+            histogram.counts[int(part)] = int(value)
+    return dict(sorted(histograms.items()))
+
+
+def render_prometheus(histograms: Dict[str, LatencyHistogram]) -> str:
+    name = "feed_stage_latency_seconds"
+    lines = [
+        f"# HELP {name} Time spent in each processing stage.",
+        f"# TYPE {name} histogram",
+    ]
+    for stage, histogram in histograms.items():
+        label = stage.replace("\\", "\\\\").replace('"', '\\"')
+        cumulative = 0
+        for bound, n in zip((*LATENCY_BUCKETS, "+Inf"), histogram.counts):
+            cumulative += n
+            lines.append(f'{name}_bucket{{stage="{label}",le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_sum{{stage="{label}"}} {histogram.sum:.6f}')
+        lines.append(f'{name}_count{{stage="{label}"}} {histogram.count}')
+    return "\n".join(lines) + "\n"
+
+# ---------------------------------------------------------------------------
+# Cache size accounting
+# ---------------------------------------------------------------------------
+
+# Counting feed:/cover: keys with KEYS blocks Redis for the whole keyspace.
+# One worker at a time walks it with SCAN every CACHE_SIZE_INTERVAL seconds
+# and stores the counts in a hash the dashboard reads.
+CACHE_SIZE_INTERVAL = float(os.getenv("CACHE_SIZE_INTERVAL", "60"))
+CACHE_SIZE_KEY = "metrics:cache:size"
+CACHE_SIZE_PREFIXES = ("feed", "cover")
+
+
+async def count_cache_keys():
+    counts = dict.fromkeys(CACHE_SIZE_PREFIXES, 0)
+    async for key in rdb.scan_iter(count=1000):
+        prefix = key.split(":", 1)[0]
+        if prefix in counts:
+            counts[prefix] += 1
+    await rdb.hset(CACHE_SIZE_KEY, mapping={**counts, "counted_at": int(time.time())})
+    return counts
+
+
+async def track_cache_size():
+    while True:
         try:
+            if await rdb.set("metrics:cache:size_lock", WORKER_ID, nx=True, ex=max(1, int(CACHE_SIZE_INTERVAL))):
+                await count_cache_keys()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logging.warning(f"Cache size scan failed: {e}")
+        await asyncio.sleep(CACHE_SIZE_INTERVAL)
+
+# ---------------------------------------------------------------------------
+# Two-tier cache: in-process LRU (L1) in front of Redis (L2)
+# ---------------------------------------------------------------------------
+
+class LRUCache:
+    """Bounded in-process cache with per-entry TTL and LRU eviction."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value, ttl: Optional[float] = None):
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: str):
+        self._data.pop(key, None)
+
+    def clear(self):
+        self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+cover_l1 = LRUCache(
+    maxsize=int(os.getenv("L1_COVER_MAXSIZE", "5000")),
+    ttl=float(os.getenv("L1_COVER_TTL", "300")),
+)
+feed_l1 = LRUCache(
+    maxsize=int(os.getenv("L1_FEED_MAXSIZE", "64")),
+    ttl=float(os.getenv("L1_FEED_TTL", "30")),
+)
+# Redis key prefix -> L1 cache holding decoded values for those keys.
+L1_CACHES = {"cover:": cover_l1, "feed:": feed_l1}
+
+# Workers publish the keys they write here so the others drop stale L1 copies.
+CACHE_INVALIDATION_CHANNEL = "cache:invalidate"
+WORKER_ID = f"{os.getpid()}-{secrets.token_hex(4)}"
+
+
+def _l1_for(key: str) -> Optional[LRUCache]:
+    for prefix, cache in L1_CACHES.items():
+        if key.startswith(prefix):
+            return cache
+    return None
+
+
+async def cache_get(key: str, ttl: Optional[float] = None):
+    """Return ``(value, tier)`` for a JSON cache key.
+
+    ``tier`` is ``"l1"`` or ``"l2"`` on a hit and ``None`` on a miss.
+    """
+    l1 = _l1_for(key)
+    value = l1.get(key) if l1 is not None else None
+    if value is not None:
+        return value, "l1"
+    if not rdb_available:
+        return None, None
+    try:
+        with timed("redis.get"):
             cached = await rdb.get(key)
-        except Exception:
-            cached = None
-    else:
-        cached = None
-    if cached:
-        await increment_cache_counter("feed", "hit")
-        return json.loads(cached)
-    await increment_cache_counter("feed", "miss")
+    except Exception:
+        return None, None
+    if not cached:
+        return None, None
     try:
-        async with httpx.AsyncClient(timeout=5) as client:
-            r = await client.get(source_url)
-            r.raise_for_status()
-            data = r.json()
-            if rdb_available:
+        value = decode_cache_value(cached)
+    except Exception:
+        return None, None
+    if l1 is not None:
+        l1.set(key, value, ttl)
+    return value, "l2"
+
+
+def _publish_invalidation(pipe, keys):
+    pipe.publish(CACHE_INVALIDATION_CHANNEL, json_dumps({"origin": WORKER_ID, "keys": list(keys)}))
+
+
+async def cache_set(key: str, value, ttl: int):
+    """Store ``value`` in both tiers and invalidate other workers' L1."""
+    l1 = _l1_for(key)
+    if l1 is not None:
+        l1.set(key, value, ttl)
+    if not rdb_available:
+        return
+    try:
+        pipe = rdb.pipeline()
+        stored, saved = encode_cache_value(value)
+        pipe.set(key, stored, ex=ttl)
+        if saved:
+            metrics_buffer.incr("metrics:bytes_saved:redis", saved)
+        _publish_invalidation(pipe, [key])
+        await pipe.execute()
+    except Exception:
+        pass
+
+
+async def cache_delete(key: str):
+    l1 = _l1_for(key)
+    if l1 is not None:
+        l1.delete(key)
+    if not rdb_available:
+        return
+    try:
+        pipe = rdb.pipeline()
+        pipe.delete(key)
+        _publish_invalidation(pipe, [key])
+        await pipe.execute()
+    except Exception:
+        pass
+
+
+def wrap_cache_entry(value) -> Dict[str, Any]:
+    """Wrap ``value`` with its store time so readers can judge freshness."""
+    return {"_t": time.time(), "v": value}
+
+
+def unwrap_cache_entry(entry) -> Tuple[Any, float]:
+    """Return ``(value, stored_at)``; entries written before wrapping count as stale."""
+    if isinstance(entry, dict) and "_t" in entry and "v" in entry:
+        return entry["v"], float(entry["_t"])
+    return entry, 0.0
+
+
+# Strong references to fire-and-forget tasks so they aren't garbage collected.
+_background_tasks = set()
+
+
+def spawn_background(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+async def listen_invalidations():
+    """Apply cache invalidations and album lookup reloads from other workers."""
+    while True:
+        pubsub = rdb.pubsub()
+        try:
+            await pubsub.subscribe(CACHE_INVALIDATION_CHANNEL, ALBUM_RELOAD_CHANNEL)
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
                 try:
-                    await rdb.set(key, json.dumps(data), ex=ttl)
+                    payload = json_loads(message["data"])
                 except Exception:
-                    pass
-            return data
+                    continue
+                if payload.get("origin") == WORKER_ID:
+                    continue
+                if message.get("channel") == ALBUM_RELOAD_CHANNEL:
+                    spawn_background(reload_album_lookup(notify=False))
+                    continue
+                for key in payload.get("keys", []):
+                    l1 = _l1_for(key)
+                    if l1 is not None:
+                        l1.delete(key)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logging.warning(f"Cache invalidation listener error: {e}")
+            # Entries may have changed while we were disconnected.
+            for cache in L1_CACHES.values():
+                cache.clear()
+            await asyncio.sleep(1)
+        finally:
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one in-flight call.
+
+    The first caller for a key runs the coroutine; callers arriving while it
+    is still running await the same result instead of starting their own.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.coalesced = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._inflight
+
+    async def do(self, key: str, func, *args, **kwargs):
+        fut = self._inflight.get(key)
+        if fut is not None:
+            self.coalesced += 1
+            increment_cache_counter(self.name, "coalesced")
+            # Shield so a cancelled waiter doesn't cancel the shared call.
+            return await asyncio.shield(fut)
+
+        self.calls += 1
+        fut = asyncio.ensure_future(func(*args, **kwargs))
+        self._inflight[key] = fut
+
+        def _done(f):
+            if self._inflight.get(key) is f:
+                del self._inflight[key]
+            if not f.cancelled():
+                f.exception()  # mark retrieved; waiters re-raise it themselves
+
+        fut.add_done_callback(_done)
+        return await asyncio.shield(fut)
+
+
+feed_flight = SingleFlight("feed")
+cover_flight = SingleFlight("cover")
+
+
+async def fetch_tracks(source_url, ttl=FEED_SOFT_TTL, hard_ttl=FEED_HARD_TTL):
+    data, _ = await fetch_tracks_with_age(source_url, ttl, hard_ttl)
+    return data or []
+
+@timed("fetch_tracks")
+async def fetch_tracks_with_age(source_url, ttl=FEED_SOFT_TTL, hard_ttl=FEED_HARD_TTL):
+    """Return ``(tracks, fetched_at)`` for ``source_url``.
+
+    Entries older than ``ttl`` are returned immediately while a background
+    task fetches a fresh copy (stale-while-revalidate). ``tracks`` is None
+    when the upstream fetch failed and nothing is cached, so callers can
+    tell a failure from a feed that really has no tracks.
+    """
+    if not source_url:
+        logging.warning("Empty source URL provided to fetch_tracks")
+        return [], time.time()
+
+    key = f"feed:{source_url}"
+    entry, tier = await cache_get(key, hard_ttl)
+    if entry is not None:
+        data, stored_at = unwrap_cache_entry(entry)
+        if time.time() - stored_at < ttl:
+            increment_cache_counter("feed", f"{tier}_hit")
+            return data, stored_at
+        if SWR_ENABLED:
+            increment_cache_counter("feed", "stale")
+            if not feed_flight.in_flight(key):
+                spawn_background(feed_flight.do(key, _fetch_upstream, source_url, key, hard_ttl))
+            return data, stored_at
+    increment_cache_counter("feed", "miss")
+    data = await feed_flight.do(key, _fetch_upstream, source_url, key, hard_ttl)
+    return data, time.time()
+
+@timed("upstream")
+async def _fetch_upstream(source_url, key, hard_ttl):
+    try:
+        r = await get_http_client("upstream").get(source_url)
+        r.raise_for_status()
+        data = json_loads(r.content)
+        await cache_set(key, wrap_cache_entry(data), hard_ttl)
+        return data
     except Exception as e:
         logging.error(f"[ERROR] Fetch failed for {source_url}: {e}")
+        return None
+
+# ---------------------------------------------------------------------------
+# SACAD cover sources
+# ---------------------------------------------------------------------------
+
+# Maximum number of SACAD searches running at once per process.
+SACAD_CONCURRENCY = int(os.getenv("SACAD_CONCURRENCY", "2"))
+# Seconds each cover source gets before it is skipped.
+SACAD_SOURCE_TIMEOUT = float(os.getenv("SACAD_SOURCE_TIMEOUT", "8"))
+# Return the best result of the first source that finds one instead of
+# waiting for every source and ranking all results together.
+SACAD_EARLY_RETURN = os.getenv("SACAD_EARLY_RETURN", "1") == "1"
+
+
+class SacadPool:
+    """Long-lived SACAD cover sources whose HTTP sessions are reused."""
+
+    def __init__(self, concurrency: int, source_timeout: float, early_return: bool):
+        self.source_timeout = source_timeout
+        self.early_return = early_return
+        self._semaphore = asyncio.Semaphore(concurrency)
+        # {(size, tolerance): [CoverSource, ...]}
+        self._sources: Dict[Tuple[int, int], list] = {}
+
+    def _get_sources(self, size: int, tol: int) -> list:
+        sources = self._sources.get((size, tol))
+        if sources is None:
+            source_classes = tuple(sacad.COVER_SOURCE_CLASSES.values())
+            sources = self._sources[(size, tol)] = [cls(size, tol) for cls in source_classes]
+        return sources
+
+    async def _search_source(self, source, artist: str, album: str) -> list:
+        try:
+            return list(await asyncio.wait_for(source.search(album, artist), self.source_timeout))
+        except asyncio.TimeoutError:
+            logging.debug(f"SACAD source {source.__class__.__name__} timed out")
+        except Exception as e:
+            logging.debug(f"SACAD source {source.__class__.__name__} failed: {e}")
         return []
 
+    @staticmethod
+    async def _best_url(results: list, size: int, tol: int) -> str:
+        results = await CoverSourceResult.preProcessForComparison(results, size, tol)
+        results.sort(
+            reverse=True,
+            key=functools.cmp_to_key(
+                functools.partial(
+                    CoverSourceResult.compare,
+                    target_size=size,
+                    size_tolerance_prct=tol,
+                )
+            ),
+        )
+        if results:
+            return results[0].urls[0]
+        return ""
+
+    async def search_url(self, artist: str, album: str, size: int = 450, tol: int = 25) -> str:
+        async with self._semaphore:
+            futs = [
+                asyncio.ensure_future(self._search_source(cs, artist, album))
+                for cs in self._get_sources(size, tol)
+            ]
+            try:
+                if self.early_return:
+                    for fut in asyncio.as_completed(futs):
+                        url = await self._best_url(await fut, size, tol)
+                        if url:
+                            return url
+                    return ""
+                results = []
+                for source_results in await asyncio.gather(*futs):
+                    results.extend(source_results)
+                return await self._best_url(results, size, tol)
+            finally:
+                for fut in futs:
+                    fut.cancel()
+
+    async def close(self):
+        for sources in self._sources.values():
+            for cs in sources:
+                try:
+                    await cs.closeSession()
+                except Exception:
+                    pass
+        self._sources.clear()
+
+
+# Created in ``lifespan``; closed on shutdown.
+sacad_pool: Optional[SacadPool] = None
+
+
+def create_sacad_pool() -> SacadPool:
+    return SacadPool(SACAD_CONCURRENCY, SACAD_SOURCE_TIMEOUT, SACAD_EARLY_RETURN)
+
+
+@timed("sacad")
 async def sacad_search_url(artist: str, album: str, size: int = 450, tol: int = 25) -> str:
     """Return the first artwork URL from SACAD without downloading."""
-    source_classes = tuple(sacad.COVER_SOURCE_CLASSES.values())
-    cover_sources = [cls(size, tol) for cls in source_classes]
-    search_futs = [asyncio.ensure_future(cs.search(album, artist)) for cs in cover_sources]
-    await asyncio.gather(*search_futs)
-    results = []
-    for fut in search_futs:
-        results.extend(fut.result())
-    results = await CoverSourceResult.preProcessForComparison(results, size, tol)
-    results.sort(
-        reverse=True,
-        key=functools.cmp_to_key(
-            functools.partial(
-                CoverSourceResult.compare,
-                target_size=size,
-                size_tolerance_prct=tol,
-            )
-        ),
-    )
-    for cs in cover_sources:
-        await cs.closeSession()
-    if results:
-        return results[0].urls[0]
-    return ""
+    if sacad_pool is not None:
+        return await sacad_pool.search_url(artist, album, size, tol)
+    # Outside the app lifespan: use a throwaway pool and always close it.
+    pool = create_sacad_pool()
+    try:
+        return await pool.search_url(artist, album, size, tol)
+    finally:
+        await pool.close()
 
-async def lookup_album_art(artist, album, title=None, ttl=300, fail_limit=3):
+async def lookup_album_art(artist, album, title=None, ttl=COVER_SOFT_TTL, fail_limit=3):
     """Lookup album art via SACAD but return the source URL."""
-    lookup_target = album or title or ""
-    hashed = hash_key(artist, lookup_target)
-    key = f"cover:{hashed}"
-    fail_key = f"fail:{hashed}"
-    fails = None
-    if rdb_available:
-        try:
-            fails = await rdb.get(fail_key)
-        except Exception:
-            fails = None
-    if fails and int(fails) >= fail_limit:
-        return {"imageUrl": "", "itunesTrackUrl": "", "previewUrl": ""}
+    results = await lookup_album_art_batch([(artist, album, title)], ttl=ttl, fail_limit=fail_limit)
+    return results[0]
+
+async def _resolve_bounded(limit: asyncio.Semaphore, artist: str, album: str, title: str):
+    async with limit:
+        return await resolve_album_art(artist, album, title)
+
+
+async def lookup_album_art_batch(tracks, ttl=COVER_SOFT_TTL, fail_limit=3, hard_ttl=COVER_HARD_TTL, block=True, limit=None):
+    """Resolve artwork for a list of ``(artist, album, title)`` tuples.
+
+    All ``fail:`` and ``cover:`` keys are read with one MGET and the counters
+    and write-backs go out in one pipeline, so a whole feed costs about two
+    Redis round trips. Only true misses reach iTunes/SACAD. Entries older
+    than ``ttl`` are served as-is and revalidated in the background.
+
+    With ``block=False`` misses are queued for the artwork workers and come
+    back as the fallback image flagged with ``artworkPending``. ``limit`` is
+    an optional semaphore bounding how many misses resolve at once.
+    """
+    cache_start = time.perf_counter()
+    now = time.time()
+    results = [None] * len(tracks)
+    counters = {"l1_hit": 0, "l2_hit": 0, "stale": 0, "miss": 0}
+    keys = []
+    for artist, album, title in tracks:
+        keys.append(cover_cache_keys(artist, album, title))
+
+    pending = []
+    stale = []
+    for i, (key, _) in enumerate(keys):
+        entry = cover_l1.get(key)
+        if entry is not None:
+            meta, stored_at = unwrap_cache_entry(entry)
+            fresh = now - stored_at < ttl
+            if fresh or SWR_ENABLED:
+                results[i] = meta
+                counters["l1_hit"] += 1
+                if not fresh:
+                    stale.append(i)
+                continue
+        pending.append(i)
 
-    cached = None
-    if rdb_available:
+    values = [None] * (2 * len(pending))
+    if pending and rdb_available:
         try:
-            cached = await rdb.get(key)
+            values = await rdb.mget(
+                *[keys[i][1] for i in pending],
+                *[keys[i][0] for i in pending],
+            )
         except Exception:
-            cached = None
-    if cached:
-        await increment_cache_counter("cover", "hit")
+            pass
+
+    invalid_keys = []
+    misses = []
+    for pos, i in enumerate(pending):
+        fails, cached = values[pos], values[len(pending) + pos]
+        if fails and int(fails) >= fail_limit:
+            results[i] = dict(EMPTY_META)
+            continue
         try:
-            meta = json.loads(cached)
+            entry = decode_cache_value(cached) if cached else None
         except Exception:
-            meta = None
+            entry = None
+        meta, stored_at = unwrap_cache_entry(entry)
         if meta:
-            image_url = str(meta.get("imageUrl", ""))
-            if image_url.startswith("data:"):
-                if rdb_available:
-                    try:
-                        await rdb.delete(key)
-                    except Exception:
-                        pass
+            if str(meta.get("imageUrl", "")).startswith("data:"):
+                invalid_keys.append(keys[i][0])
             else:
-                return meta
-
-    await increment_cache_counter("cover", "miss")
+                fresh = now - stored_at < ttl
+                if fresh or SWR_ENABLED:
+                    cover_l1.set(keys[i][0], entry, hard_ttl)
+                    results[i] = meta
+                    counters["l2_hit"] += 1
+                    if not fresh:
+                        stale.append(i)
+                    continue
+        misses.append(i)
+    counters["stale"] = len(stale)
+    counters["miss"] = len(misses)
+    observe_latency("album_art.cache", time.perf_counter() - cache_start)
+
+    # The same track can appear more than once in a feed; resolve it once.
+    unique_misses = list({keys[i][0]: i for i in misses}.values())
+    if not block and artwork_queue is not None:
+        queued = {keys[i][0] for i in unique_misses if enqueue_artwork(keys[i], tracks[i], hard_ttl)}
+        for i in misses:
+            results[i] = {"imageUrl": FALLBACK_IMAGE, "itunesTrackUrl": "", "previewUrl": ""}
+            # A dropped job is not pending; the next render queues it again.
+            if keys[i][0] in queued:
+                results[i]["artworkPending"] = True
+        misses = []
+        unique_misses = []
+    resolve = resolve_album_art if limit is None else functools.partial(_resolve_bounded, limit)
+    resolved = await asyncio.gather(
+        *(cover_flight.do(keys[i][0], resolve, *tracks[i]) for i in unique_misses),
+        return_exceptions=True,
+    )
+    resolved_by_key = {keys[i][0]: meta for i, meta in zip(unique_misses, resolved)}
+
+    found = {}
+    failed = []
+    for i in misses:
+        key, fail_key = keys[i]
+        meta = resolved_by_key[key]
+        if isinstance(meta, dict) and meta.get("imageUrl"):
+            found[key] = wrap_cache_entry(meta)
+            cover_l1.set(key, found[key], hard_ttl)
+            results[i] = meta
+        elif isinstance(meta, ITunesSkipped):
+            # Not counted towards fail_limit; the next render tries again.
+            results[i] = {"imageUrl": FALLBACK_IMAGE, "itunesTrackUrl": "", "previewUrl": ""}
+        else:
+            if fail_key not in failed:
+                failed.append(fail_key)
+            # Return fallback image for better user experience
+            artist, album, title = tracks[i]
+            logging.info(f"No album art found for {artist} - {album or title or ''}, using fallback")
+            results[i] = {"imageUrl": FALLBACK_IMAGE, "itunesTrackUrl": "", "previewUrl": ""}
+    for key in invalid_keys:
+        cover_l1.delete(key)
+
+    for status, count in counters.items():
+        if count:
+            increment_cache_counter("cover", status, count)
+    if rdb_available and (found or failed or invalid_keys):
+        try:
+            pipe = rdb.pipeline(transaction=False)
+            for key in invalid_keys:
+                pipe.delete(key)
+            for key, entry in found.items():
+                stored, saved = encode_cache_value(entry)
+                pipe.set(key, stored, ex=hard_ttl)
+                if saved:
+                    metrics_buffer.incr("metrics:bytes_saved:redis", saved)
+            for fail_key in failed:
+                pipe.incr(fail_key)
+                pipe.expire(fail_key, 86400)
+            if invalid_keys or found:
+                _publish_invalidation(pipe, invalid_keys + list(found))
+            await pipe.execute()
+        except Exception:
+            pass
 
-    manual_meta = await get_manual_podcast_metadata(title or "")
-    if manual_meta and manual_meta.get("imageUrl"):
-        if rdb_available:
-            try:
-                await rdb.set(key, json.dumps(manual_meta), ex=ttl)
-            except Exception:
-                pass
-        return manual_meta
+    for i in stale:
+        key = keys[i][0]
+        if not cover_flight.in_flight(key):
+            spawn_background(_revalidate_cover(key, tracks[i], results[i], hard_ttl))
 
-    # Try the iTunes Search API first — it applies additional normalization
-    # checks so we are less likely to pick an incorrect match.
-    itunes_meta = None
-    try:
-        itunes_meta = await lookup_itunes_metadata(artist, title or "", album=album or None)
-    except Exception as exc:
-        logging.debug(f"iTunes lookup failed for {artist} - {title or album}: {exc}")
+    return results
 
-    if itunes_meta and itunes_meta.get("imageUrl"):
-        if rdb_available:
-            try:
-                await rdb.set(key, json.dumps(itunes_meta), ex=ttl)
-            except Exception:
-                pass
-        return itunes_meta
+# ---------------------------------------------------------------------------
+# Background artwork resolution
+# ---------------------------------------------------------------------------
 
-    # Fall back to SACAD only if iTunes could not provide artwork.
-    search_term = album or title or ""
-    if search_term:
+# When enabled, feeds are rendered from cached artwork only and misses are
+# resolved by a pool of workers instead of blocking the render.
+ARTWORK_ASYNC = os.getenv("ARTWORK_ASYNC", "0") == "1"
+ARTWORK_QUEUE_SIZE = int(os.getenv("ARTWORK_QUEUE_SIZE", "256"))
+ARTWORK_WORKERS = int(os.getenv("ARTWORK_WORKERS", "4"))
+
+# Created in ``lifespan`` when ARTWORK_ASYNC is set.
+artwork_queue: Optional[asyncio.Queue] = None
+# Cover keys currently queued or being resolved.
+_artwork_queued = set()
+# Bumped whenever a worker stores a cover so the poller re-renders pending
+# feeds. Skipped or failed lookups leave it alone; those feeds are retried
+# after FEED_RENDER_MAX_AGE instead of re-rendering every poll.
+artwork_generation = 0
+
+
+def enqueue_artwork(keys, track, hard_ttl) -> bool:
+    """Queue a cover miss for the workers; returns False if the queue is full."""
+    key = keys[0]
+    if key in _artwork_queued:
+        return True
+    try:
+        artwork_queue.put_nowait((keys, track, hard_ttl))
+    except asyncio.QueueFull:
+        logging.warning(f"Artwork queue full, dropping lookup for {track[0]} - {track[1] or track[2]}")
+        return False
+    _artwork_queued.add(key)
+    return True
+
+
+async def artwork_worker():
+    """Resolve queued cover misses and store the results in the cache."""
+    global artwork_generation
+    while True:
+        (key, fail_key), track, hard_ttl = await artwork_queue.get()
         try:
-            url = await sacad_search_url(artist, search_term)
-            if url:
-                meta = {"imageUrl": url, "itunesTrackUrl": "", "previewUrl": ""}
+            meta = await cover_flight.do(key, resolve_album_art, *track)
+            if meta and meta.get("imageUrl"):
+                await cache_set(key, wrap_cache_entry(meta), hard_ttl)
+                artwork_generation += 1
+            else:
+                artist, album, title = track
+                logging.info(f"No album art found for {artist} - {album or title or ''}, using fallback")
                 if rdb_available:
-                    try:
-                        await rdb.set(key, json.dumps(meta), ex=ttl)
-                    except Exception:
-                        pass
-                return meta
+                    pipe = rdb.pipeline(transaction=False)
+                    pipe.incr(fail_key)
+                    pipe.expire(fail_key, 86400)
+                    await pipe.execute()
+        except asyncio.CancelledError:
+            raise
+        except ITunesSkipped as e:
+            logging.debug(f"Background artwork lookup deferred for {key}: {e}")
         except Exception as e:
-            logging.error(f"[ERROR] SACAD lookup failed: {e}")
+            logging.error(f"[ERROR] Background artwork lookup failed for {key}: {e}")
+        finally:
+            _artwork_queued.discard(key)
+            artwork_queue.task_done()
 
-    if rdb_available:
+
+async def _revalidate_cover(key, track, stale_meta, hard_ttl):
+    """Refresh a stale cover entry, keeping the old artwork if nothing is found."""
+    try:
+        meta = await cover_flight.do(key, resolve_album_art, *track)
+    except Exception as e:
+        logging.debug(f"Cover revalidation failed for {key}: {e}")
+        meta = None
+    if not meta or not meta.get("imageUrl"):
+        meta = stale_meta
+    await cache_set(key, wrap_cache_entry(meta), hard_ttl)
+
+async def resolve_album_art(artist, album, title=None) -> Optional[Dict[str, str]]:
+    """Resolve artwork from manual overrides, iTunes and then SACAD."""
+    # The stage is relabelled with the source that produced the artwork.
+    with timed("album_art.fallback") as timer:
+        manual_meta = await get_manual_podcast_metadata(title or "")
+        if manual_meta and manual_meta.get("imageUrl"):
+            timer.stage = "album_art.manual"
+            return manual_meta
+
+        # Try the iTunes Search API first — it applies additional normalization
+        # checks so we are less likely to pick an incorrect match.
+        itunes_meta = None
+        itunes_skipped = False
         try:
-            await rdb.incr(fail_key)
-            await rdb.expire(fail_key, 86400)
-        except Exception:
-            pass
-    
-    # Return fallback image for better user experience
-    logging.info(f"No album art found for {artist} - {search_term}, using fallback")
-    return {"imageUrl": FALLBACK_IMAGE, "itunesTrackUrl": "", "previewUrl": ""}
+            itunes_meta = await lookup_itunes_metadata(artist, title or "", album=album or None)
+        except ITunesSkipped:
+            itunes_skipped = True
+        except Exception as exc:
+            logging.debug(f"iTunes lookup failed for {artist} - {title or album}: {exc}")
+
+        if itunes_meta and itunes_meta.get("imageUrl"):
+            timer.stage = "album_art.itunes"
+            return itunes_meta
+
+        # Fall back to SACAD only if iTunes could not provide artwork.
+        search_term = album or title or ""
+        if search_term:
+            try:
+                url = await sacad_search_url(artist, search_term)
+                if url:
+                    timer.stage = "album_art.sacad"
+                    return {"imageUrl": url, "itunesTrackUrl": "", "previewUrl": ""}
+            except Exception as e:
+                logging.error(f"[ERROR] SACAD lookup failed: {e}")
+
+        if itunes_skipped:
+            # iTunes was never asked, so this is not a real miss; retry later.
+            timer.stage = "album_art.deferred"
+            raise ITunesSkipped(f"iTunes skipped for {artist} - {album or title or ''}")
+        return None
 
 def _parse_duration(dur: str) -> int:
     try:
@@ -715,252 +2205,731 @@ def _parse_duration(dur: str) -> int:
         return 180
 
 
-async def to_spec_format(raw_tracks):
-    central = timezone("America/Chicago")
-    tasks = []
-    for t in raw_tracks:
-        artist = t.get("TPE1", "Family Radio")
-        title = t.get("TIT2", "")
-        album_csv = get_csv_album(artist, title)
-        album = album_csv or t.get("TALB", title)
-        if is_family_radio(artist, title):
-            tasks.append(asyncio.sleep(0, result=EMPTY_META))
-        else:
-            tasks.append(lookup_album_art(artist, album, title))
-    metadatas = await asyncio.gather(*tasks)
-    formatted = []
+# Items built by the previous render of each feed, keyed by the raw fields
+# they depend on. Upstream lists shift by one track per song, so most items
+# are reused as-is. Only items with final artwork are kept.
+spec_item_cache: Dict[str, Dict[tuple, dict]] = {}
+
+CENTRAL_TZ = timezone("America/Chicago")
+
+
+def _track_timestamp(t, prev_ts):
+    for key in ("played_on", "start_time", "last_seen"):
+        val = t.get(key)
+        if val:
+            return float(val)
+    if prev_ts is None:
+        return datetime.now().timestamp()
+    return prev_ts - _parse_duration(t.get("duration", "00:03:00"))
+
+
+def _build_item(t, artist, title, album_csv, ts, meta):
+    base_key = hash_key(artist, title)
+    item = {
+        "id": hashlib.sha1(f"{base_key}|{ts}".encode()).hexdigest(),
+        "artist": artist,
+        "title": title,
+        "album": album_csv or t.get("TALB", ""),
+        "time": datetime.fromtimestamp(ts, tz=CENTRAL_TZ).isoformat(),
+        "imageUrl": meta["imageUrl"],
+        "itunesTrackUrl": meta["itunesTrackUrl"],
+        "previewUrl": meta["previewUrl"],
+        "duration": t.get("duration", "00:03:00"),
+        "status": "history",
+        "type": "song",
+    }
+    if meta.get("artworkPending"):
+        item["artworkPending"] = True
+    return item
+
+
+@timed("render")
+async def to_spec_format(raw_tracks, limit=None, feed=None):
+    """Render upstream tracks into ``nowPlaying`` items, newest first.
+
+    With ``feed`` set, tracks unchanged since the previous render reuse
+    their items and only new tracks get CSV and artwork lookups.
+    """
+    previous = spec_item_cache.get(feed, {}) if feed else {}
+    keys = []
+    builds = []
     prev_ts = None
-    for t, meta in zip(raw_tracks, metadatas):
+    for t in raw_tracks:
         artist = t.get("TPE1", "Family Radio")
         title = t.get("TIT2", "")
-        album_csv = get_csv_album(artist, title)
-
-        ts = None
-        for key in ("played_on", "start_time", "last_seen"):
-            val = t.get(key)
-            if val:
-                ts = float(val)
-                break
-        if ts is None:
-            if prev_ts is None:
-                ts = datetime.now().timestamp()
-            else:
-                ts = prev_ts - _parse_duration(t.get("duration", "00:03:00"))
+        ts = _track_timestamp(t, prev_ts)
         prev_ts = ts
-        ts_dt = datetime.fromtimestamp(ts, tz=central)
-
-        base_key = hash_key(artist, title)
-        stable_id = hashlib.sha1(f"{base_key}|{ts}".encode()).hexdigest()
-
-        formatted.append({
-            "id": stable_id,
-            "artist": artist,
-            "title": title,
-            "album": album_csv or t.get("TALB", ""),
-            "time": ts_dt.isoformat(),
-            "imageUrl": meta["imageUrl"],
-            "itunesTrackUrl": meta["itunesTrackUrl"],
-            "previewUrl": meta["previewUrl"],
-            "duration": t.get("duration", "00:03:00"),
-            "status": "history",
-            "type": "song",
-            "_ts": ts,
-        })
-
-    formatted.sort(key=lambda x: x["_ts"], reverse=True)
+        key = (artist, title, ts, t.get("TALB", ""), t.get("duration", "00:03:00"))
+        keys.append(key)
+        if key not in previous:
+            builds.append((t, artist, title, ts, key))
+
+    built = {}
+    if builds:
+        album_csvs = [get_csv_album(artist, title) for _, artist, title, _, _ in builds]
+        metadatas = [EMPTY_META] * len(builds)
+        lookups = []
+        lookup_indexes = []
+        for i, ((t, artist, title, _, _), album_csv) in enumerate(zip(builds, album_csvs)):
+            if not is_family_radio(artist, title):
+                lookups.append((artist, album_csv or t.get("TALB", title), title))
+                lookup_indexes.append(i)
+        for i, meta in zip(lookup_indexes, await lookup_album_art_batch(lookups, block=not ARTWORK_ASYNC, limit=limit)):
+            metadatas[i] = meta
+        for (t, artist, title, ts, key), album_csv, meta in zip(builds, album_csvs, metadatas):
+            built[key] = _build_item(t, artist, title, album_csv, ts, meta)
+
+    items = {key: previous.get(key) or built[key] for key in keys}
+    if feed:
+        # Pending or fallback artwork gets another lookup on the next render.
+        spec_item_cache[feed] = {
+            key: item for key, item in items.items()
+            if not item.get("artworkPending") and item["imageUrl"] != FALLBACK_IMAGE
+        }
 
+    # Newest first; sorting is stable, so equal timestamps keep upstream order.
+    ordered = sorted(((key[2], items[key]) for key in keys), key=lambda pair: pair[0], reverse=True)
     seen = set()
-    deduped = []
-    for item in formatted:
-        key = item["id"]
-        if key not in seen:
-            seen.add(key)
-            deduped.append(item)
+    formatted = []
+    for _, item in ordered:
+        if item["id"] in seen:
+            continue
+        seen.add(item["id"])
+        # Copy so cached items are never mutated.
+        formatted.append({**item, "status": "playing" if not formatted else "history"})
+    return formatted
 
-    ts_values = [i["_ts"] for i in deduped]
-    assert ts_values == sorted(ts_values, reverse=True)
+# ---------------------------------------------------------------------------
+# Pre-rendered feeds
+# ---------------------------------------------------------------------------
 
-    if deduped:
-        deduped[0]["status"] = "playing"
+@dataclass
+class RenderedFeed:
+    """A fully rendered feed response ready to be sent as-is."""
+    body: bytes
+    signature: str
+    rendered_at: float
+    checked_at: float
+    fetched_at: float
+    # artwork_generation at render time; only set while artwork is pending
+    pending_generation: Optional[int] = None
+    # Strong validator of ``body`` and when that body first appeared
+    etag: str = ""
+    last_modified: float = 0.0
+    # Compressed variants of ``body`` by content coding ("gzip", "br")
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+
+
+# Latest rendered response per feed name {feed: RenderedFeed}
+rendered_feeds: Dict[str, RenderedFeed] = {}
+
+# ---------------------------------------------------------------------------
+# Push streams (SSE / WebSocket)
+# ---------------------------------------------------------------------------
+
+# Payloads buffered per client before it is treated as a slow consumer.
+FEED_STREAM_QUEUE_SIZE = int(os.getenv("FEED_STREAM_QUEUE_SIZE", "4"))
+# Maximum concurrent stream clients per worker.
+FEED_STREAM_MAX_CLIENTS = int(os.getenv("FEED_STREAM_MAX_CLIENTS", "5000"))
+# Seconds between keep-alive comments so proxies don't drop idle streams.
+FEED_STREAM_HEARTBEAT = float(os.getenv("FEED_STREAM_HEARTBEAT", "15"))
+# Name the serving worker in an X-Worker header (for benchmarks/loadtest_sse.py).
+FEED_STREAM_WORKER_HEADER = os.getenv("FEED_STREAM_WORKER_HEADER", "0") == "1"
+
+
+class Broadcaster:
+    """Fan rendered feeds out to stream subscribers.
+
+    The poller is the single producer. Each subscriber owns a bounded queue;
+    a client whose queue is full is evicted instead of buffering without
+    limit or slowing the others down.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self.evicted = 0
+        self._subscribers: Dict[str, set] = {}
+
+    def __len__(self):
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    def count(self, feed: str) -> int:
+        return len(self._subscribers.get(feed, ()))
+
+    def subscribe(self, feed: str) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(feed, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, feed: str, queue: asyncio.Queue):
+        self._subscribers.get(feed, set()).discard(queue)
+
+    def _evict(self, feed: str, queue: asyncio.Queue):
+        self.unsubscribe(feed, queue)
+        # Drop the backlog and leave the end-of-stream marker.
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    def publish(self, feed: str, rendered: RenderedFeed):
+        for queue in list(self._subscribers.get(feed, ())):
+            try:
+                queue.put_nowait(rendered)
+            except asyncio.QueueFull:
+                self.evicted += 1
+                self._evict(feed, queue)
+
+    def close(self):
+        """End every stream, e.g. on shutdown."""
+        for feed, queues in list(self._subscribers.items()):
+            for queue in list(queues):
+                self._evict(feed, queue)
+
+
+feed_broadcaster = Broadcaster(FEED_STREAM_QUEUE_SIZE)
+
+
+class FeedStreamResponse(StreamingResponse):
+    """SSE response that drops a client stalled on its socket.
+
+    A full queue only evicts a client after several song changes, and a
+    client blocked in ``send`` never reads the end-of-stream marker. Each
+    chunk therefore gets ``FEED_STREAM_HEARTBEAT`` seconds to go out before
+    the stream is abandoned and the server closes the connection.
+    """
+
+    async def stream_response(self, send):
+        async def send_with_timeout(message):
+            await asyncio.wait_for(send(message), FEED_STREAM_HEARTBEAT)
+
+        try:
+            await super().stream_response(send_with_timeout)
+        except asyncio.TimeoutError:
+            feed_broadcaster.evicted += 1
+            logging.info("Dropping stalled stream client")
+        finally:
+            await self.body_iterator.aclose()
+
+
+def _tracks_signature(raw_tracks) -> str:
+    """Return a digest of the upstream track list used to detect changes."""
+    return hashlib.sha1(json_dumpb(raw_tracks, sort_keys=True)).hexdigest()
+
+
+def _encode_feed(now_playing) -> bytes:
+    # Same compact encoding as JSONResponse, done once per render.
+    return json_dumpb({"nowPlaying": now_playing})
+
+
+async def refresh_rendered_feed(feed: str, source_url: str) -> RenderedFeed:
+    """Fetch ``source_url`` and re-render ``feed`` if upstream changed."""
+    soft_ttl, hard_ttl = FEED_TTLS.get(feed, (FEED_SOFT_TTL, FEED_HARD_TTL))
+    data, fetched_at = await fetch_tracks_with_age(source_url, soft_ttl, hard_ttl)
+    now = time.time()
+    current = rendered_feeds.get(feed)
+    if data is None:
+        if current and SWR_ENABLED and now - current.fetched_at < hard_ttl:
+            # Upstream failed: keep serving the last good payload.
+            current.checked_at = now
+            return current
+        data = []
+    signature = _tracks_signature(data)
+    if (
+        current
+        and current.signature == signature
+        and now - current.rendered_at < FEED_RENDER_MAX_AGE
+        and current.pending_generation in (None, artwork_generation)
+    ):
+        current.checked_at = now
+        current.fetched_at = fetched_at
+        return current
+
+    generation = artwork_generation
+    now_playing = await to_spec_format(data, limit=feed_semaphores.get(feed), feed=feed)
+    pending = any(item.get("artworkPending") for item in now_playing)
+    body = _encode_feed(now_playing)
+    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+    rendered = RenderedFeed(
+        body=body,
+        signature=signature,
+        rendered_at=now,
+        checked_at=now,
+        fetched_at=fetched_at,
+        pending_generation=generation if pending else None,
+        etag=etag,
+        encoded=compress_feed(body),
+        # A re-render with identical output keeps the original timestamp.
+        last_modified=current.last_modified if current and current.etag == etag else now,
+    )
+    rendered_feeds[feed] = rendered
+    if current is None or current.etag != etag:
+        feed_broadcaster.publish(feed, rendered)
+    return rendered
+
+
+# The poller and request-path fallback renders share one in-flight render
+# per feed, so a slow render is never started twice.
+render_flight = SingleFlight("render")
 
-    for f in deduped:
-        f.pop("_ts", None)
 
-    return deduped
+async def poll_feed(feed: str, source_url: str):
+    """Keep ``rendered_feeds[feed]`` up to date until cancelled."""
+    while True:
+        try:
+            await render_flight.do(feed, refresh_rendered_feed, feed, source_url)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logging.error(f"[ERROR] Rendering {feed} feed failed: {e}")
+        await asyncio.sleep(FEEDS[feed].poll_interval)
+
+
+async def get_rendered_feed(feed: str) -> RenderedFeed:
+    """Return the pre-rendered feed, rendering inline if the poller lags."""
+    rendered = rendered_feeds.get(feed)
+    # Only render on the request path before the first poll completes or if
+    # the poller stopped making progress.
+    if rendered is None or time.time() - rendered.checked_at > FEEDS[feed].poll_interval * 3:
+        if rendered is not None and render_flight.in_flight(feed):
+            # A render is already running; keep serving the last one.
+            return rendered
+        rendered = await render_flight.do(feed, refresh_rendered_feed, feed, FEED_SOURCES[feed])
+    return rendered
+
+
+# ---------------------------------------------------------------------------
+# Feed health probes
+# ---------------------------------------------------------------------------
+
+# Every HEALTH_PROBE_INTERVAL seconds one worker fetches each upstream feed
+# directly (bypassing the feed cache and its counters) and records the
+# outcome in the ``health:{feed}`` hash. The dashboard only reads that state.
+HEALTH_PROBE_INTERVAL = float(os.getenv("HEALTH_PROBE_INTERVAL", "60"))
+HEALTH_KEY_PREFIX = "health:"
+# Feeds not probed for this many intervals are reported as stale.
+HEALTH_STALE_INTERVALS = 3
+
+# Latest probe results of this worker, used when Redis is unavailable.
+feed_health: Dict[str, dict] = {}
+
+
+async def probe_feed(feed: str) -> dict:
+    """Fetch ``feed``'s upstream once and describe the outcome."""
+    start = time.perf_counter()
+    result = {"status": "error", "checked_at": int(time.time()), "latency_ms": 0, "size": 0, "tracks": 0, "error": ""}
+    try:
+        r = await get_http_client("upstream").get(FEED_SOURCES[feed])
+        result["latency_ms"] = round((time.perf_counter() - start) * 1000)
+        result["size"] = len(r.content)
+        r.raise_for_status()
+        tracks = json_loads(r.content)
+        if not isinstance(tracks, list) or not tracks:
+            result["error"] = "empty payload"
+        else:
+            result.update(status="ok", tracks=len(tracks))
+    except httpx.HTTPStatusError as e:
+        result["error"] = f"HTTP {e.response.status_code}"
+    except httpx.TimeoutException:
+        result["error"] = "timeout"
+    except ValueError:
+        result["error"] = "invalid JSON"
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"[:200]
+    if not result["latency_ms"]:
+        result["latency_ms"] = round((time.perf_counter() - start) * 1000)
+    return result
+
+
+async def probe_feed_health():
+    while True:
+        try:
+            if not rdb_available or await rdb.set(
+                "health:probe_lock", WORKER_ID, nx=True, ex=max(1, int(HEALTH_PROBE_INTERVAL))
+            ):
+                await record_feed_health()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logging.warning(f"Feed health probe failed: {e}")
+        await asyncio.sleep(HEALTH_PROBE_INTERVAL)
+
+
+async def record_feed_health():
+    feeds = list(FEEDS)
+    results = await asyncio.gather(*(probe_feed(f) for f in feeds))
+    checked = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    for feed, result in zip(feeds, results):
+        if result["status"] == "ok":
+            result["last_success"] = result["checked_at"]
+        elif feed in feed_health and "last_success" in feed_health[feed]:
+            result["last_success"] = feed_health[feed]["last_success"]
+        feed_health[feed] = result
+        if result["status"] != "ok":
+            logging.warning(f"Health probe for {feed} feed failed: {result['error']}")
+    if not rdb_available:
+        return
+    ttl = int(HEALTH_PROBE_INTERVAL * HEALTH_STALE_INTERVALS * 10)
+    pipe = rdb.pipeline(transaction=False)
+    for feed, result in zip(feeds, results):
+        key = f"{HEALTH_KEY_PREFIX}{feed}"
+        # last_success is only overwritten by a successful probe, so another
+        # worker's earlier success survives this worker's failure.
+        pipe.hset(key, mapping={k: v for k, v in result.items() if k != "last_success" or result["status"] == "ok"})
+        pipe.expire(key, ttl)
+        pipe.set(f"last_feed_check:{feed}", checked, ex=ttl)
+    pipe.set("last_feed_check", checked, ex=ttl)
+    await pipe.execute()
+
+
+def health_status(feed: str, record: Optional[dict]) -> str:
+    """Return ``ok``, ``error``, ``stale`` or ``unknown`` for ``feed``.
+
+    Uses the probe record, or the poller's last upstream data when probing
+    is disabled. ``unknown`` (nothing recorded yet) is not an error.
+    """
+    now = time.time()
+    if HEALTH_PROBE_INTERVAL <= 0:
+        rendered = rendered_feeds.get(feed)
+        if rendered is None:
+            return "unknown"
+        soft_ttl, _ = FEED_TTLS.get(feed, (FEED_SOFT_TTL, FEED_HARD_TTL))
+        # fetched_at only moves when upstream answered (stale-while-revalidate
+        # keeps the old time while upstream fails).
+        max_age = soft_ttl + FEEDS[feed].poll_interval * HEALTH_STALE_INTERVALS
+        return "ok" if now - rendered.fetched_at <= max_age else "stale"
+    if not record:
+        return "unknown"
+    if now - float(record.get("checked_at", 0)) > HEALTH_PROBE_INTERVAL * HEALTH_STALE_INTERVALS:
+        return "stale"
+    return "ok" if record.get("status") == "ok" else "error"
+
 
 def get_client_id(request: Request):
     return request.client.host
 
-@app.get("/", response_class=HTMLResponse)
-def homepage():
-    return HTML_TEMPLATE
 
-@app.get("/east-feed.json")
-async def feed_east(request: Request):
-    client_id = get_client_id(request)
-    await increment_metrics("east", client_id)
-    data = await fetch_tracks(SOURCE_EAST)
-    return JSONResponse({"nowPlaying": await to_spec_format(data)})
+def _variant_etag(rendered: RenderedFeed, encoding: Optional[str]) -> str:
+    # Each content coding is its own representation and needs its own tag.
+    return rendered.etag if encoding is None else f'{rendered.etag[:-1]}-{encoding}"'
 
-@app.get("/west-feed.json")
-async def feed_west(request: Request):
-    client_id = get_client_id(request)
-    await increment_metrics("west", client_id)
-    data = await fetch_tracks(SOURCE_WEST)
-    return JSONResponse({"nowPlaying": await to_spec_format(data)})
 
-@app.get("/worship-feed.json")
-async def feed_worship(request: Request):
-    client_id = get_client_id(request)
-    await increment_metrics("worship", client_id)
-    data = await fetch_tracks(SOURCE_THIRD)
-    return JSONResponse({"nowPlaying": await to_spec_format(data)})
+def _not_modified(request: Request, rendered: RenderedFeed) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since against ``rendered``."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # Weak comparison, as RFC 9110 requires for If-None-Match; every
+        # encoding of the same body counts as a match.
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        current = {_variant_etag(rendered, e) for e in (None, *rendered.encoded)}
+        return "*" in tags or not tags.isdisjoint(current)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(rendered.last_modified) <= since
+    return False
 
 
-@app.get("/fourth-feed.json")
-async def feed_fourth(request: Request):
+async def serve_feed(request: Request, feed: str) -> Response:
     client_id = get_client_id(request)
-    await increment_metrics("fourth", client_id)
-    data = await fetch_tracks(SOURCE_FOURTH)
-    return JSONResponse({"nowPlaying": await to_spec_format(data)})
+    rendered = await get_rendered_feed(feed)
+    encoding = negotiate_encoding(request.headers.get("accept-encoding", ""), rendered.encoded)
+    body = rendered.body if encoding is None else rendered.encoded[encoding]
+    headers = {
+        # Freshness of the upstream data. Not the standard Age header, which
+        # caches subtract from max-age (or ignore, keeping the copy longer).
+        "X-Data-Age": str(max(0, int(time.time() - rendered.fetched_at))),
+        "ETag": _variant_etag(rendered, encoding),
+        "Last-Modified": formatdate(rendered.last_modified, usegmt=True),
+        "Vary": "Accept-Encoding",
+    }
+    if FEED_CACHE_MAX_AGE > 0:
+        headers["Cache-Control"] = f"public, max-age={FEED_CACHE_MAX_AGE}, s-maxage={FEED_CACHE_MAX_AGE}"
+    else:
+        headers["Cache-Control"] = "no-cache"
+    if _not_modified(request, rendered):
+        increment_metrics(feed, client_id)
+        return Response(status_code=304, headers=headers)
+    increment_metrics(feed, client_id, len(rendered.body) - len(body))
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+async def _feed_updates(feed: str, last_etag: Optional[str] = None):
+    """Yield the current feed, then every change, until evicted.
+
+    Yields None when ``FEED_STREAM_HEARTBEAT`` passes without a change.
+    """
+    queue = feed_broadcaster.subscribe(feed)
+    try:
+        rendered = await get_rendered_feed(feed)
+        if rendered.etag != last_etag:
+            yield rendered
+            last_etag = rendered.etag
+        while True:
+            try:
+                rendered = await asyncio.wait_for(queue.get(), FEED_STREAM_HEARTBEAT)
+            except asyncio.TimeoutError:
+                yield None
+                continue
+            if rendered is None:
+                return
+            if rendered.etag != last_etag:
+                yield rendered
+                last_etag = rendered.etag
+    finally:
+        feed_broadcaster.unsubscribe(feed, queue)
+
+
+@app.get("/{feed}-feed/events")
+async def feed_events(request: Request, feed: str):
+    """Server-Sent Events stream of ``feed``; one event per change."""
+    if feed not in FEEDS:
+        return JSONResponse(status_code=404, content={"detail": "Not Found"})
+    if len(feed_broadcaster) >= FEED_STREAM_MAX_CLIENTS:
+        return JSONResponse(status_code=503, content={"detail": "Too many stream clients"})
+    increment_metrics(feed, get_client_id(request))
+
+    async def events():
+        # The ETag doubles as the event id so reconnects skip an unchanged payload.
+        async for rendered in _feed_updates(feed, request.headers.get("last-event-id")):
+            if rendered is None:
+                yield b": keep-alive\n\n"
+            else:
+                yield b"event: nowPlaying\nid: " + rendered.etag.encode() + b"\ndata: " + rendered.body + b"\n\n"
 
-@app.get("/fifth-feed.json")
-async def feed_fifth(request: Request):
-    client_id = get_client_id(request)
-    await increment_metrics("fifth", client_id)
-    data = await fetch_tracks(SOURCE_FIFTH)
-    return JSONResponse({"nowPlaying": await to_spec_format(data)})
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    if FEED_STREAM_WORKER_HEADER:
+        headers["X-Worker"] = WORKER_ID
+    return FeedStreamResponse(events(), media_type="text/event-stream", headers=headers)
 
-@app.get("/sixth-feed.json")
-async def feed_sixth(request: Request):
-    client_id = get_client_id(request)
-    await increment_metrics("sixth", client_id)
-    data = await fetch_tracks(SOURCE_SIXTH)
-    return JSONResponse({"nowPlaying": await to_spec_format(data)})
+
+@app.websocket("/{feed}-feed/ws")
+async def feed_websocket(websocket: WebSocket, feed: str):
+    """WebSocket variant of the events stream; sends the feed JSON on each change."""
+    if feed not in FEEDS or len(feed_broadcaster) >= FEED_STREAM_MAX_CLIENTS:
+        await websocket.close(code=1008 if feed not in FEEDS else 1013)
+        return
+    await websocket.accept()
+    increment_metrics(feed, websocket.client.host)
+
+    async def send_updates():
+        async for rendered in _feed_updates(feed):
+            if rendered is not None:
+                try:
+                    await asyncio.wait_for(websocket.send_text(rendered.body.decode("utf-8")), FEED_STREAM_HEARTBEAT)
+                except asyncio.TimeoutError:
+                    # Stalled on its socket: evict it like a full queue would.
+                    feed_broadcaster.evicted += 1
+                    return
+
+    async def wait_for_disconnect():
+        # Clients don't need to send anything; this notices them leaving.
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
+    sender = asyncio.create_task(send_updates())
+    receiver = asyncio.create_task(wait_for_disconnect())
+    done, pending = await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(sender, receiver, return_exceptions=True)
+    if receiver not in done:
+        # Evicted as a slow consumer or shutting down: ask the client to retry.
+        # A stalled client may not take the close frame either; returning
+        # lets the server drop the connection.
+        try:
+            await asyncio.wait_for(websocket.close(code=1013), FEED_STREAM_HEARTBEAT)
+        except Exception:
+            pass
+
+@app.get("/", response_class=HTMLResponse)
+def homepage():
+    return HOMEPAGE_HTML
+
+@app.get("/{feed}-feed.json")
+async def feed_json(request: Request, feed: str):
+    if feed not in FEEDS:
+        return JSONResponse(status_code=404, content={"detail": "Not Found"})
+    return await serve_feed(request, feed)
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Stage latency histograms in the Prometheus text format.
+
+    Served from the totals all workers flushed to Redis, or from this
+    worker's own histograms when Redis is unavailable.
+    """
+    raw = None
+    if rdb_available:
+        try:
+            raw = await rdb.hgetall(LATENCY_KEY)
+        except Exception:
+            pass
+    return Response(render_prometheus(latency_snapshot(raw)), media_type="text/plain; version=0.0.4")
 
 @app.get("/admin/dashboard", response_class=HTMLResponse)
 async def admin_dashboard(request: Request):
 
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    async def get_feed_metrics(feed):
-        if not rdb_available:
-            periods = ["minute", "hour", "day", "week", "month", "year"]
-            return {
-                "feed": feed,
-                "total": {p: 0 for p in periods},
-                "unique": {p: 0 for p in periods},
-            }
+    periods = ["minute", "hour", "day", "week", "month", "year"]
+
+    def queue_feed_metrics(pipe, feed):
         keys = get_metrics_keys(feed)
         unique_keys = get_unique_keys(feed)
-        values = await rdb.mget(*list(keys.values()))
-        unique_vals = []
-        for k in unique_keys.values():
-            unique_vals.append(await rdb.scard(k))
-        periods = ["minute", "hour", "day", "week", "month", "year"]
+        pipe.mget(*list(keys.values()))
+        pipe.pfcount(unique_keys["minute"])
+        pipe.pfcount(unique_keys["hour"])
+        pipe.pfcount(unique_keys["day"])
+        # Union with today's HLL covers hits since the last rollup.
+        pipe.pfcount(unique_keys["week"], unique_keys["day"])
+        pipe.pfcount(unique_keys["month"], unique_keys["day"])
+        pipe.pfcount(unique_keys["year"], unique_keys["month"], unique_keys["day"])
+
+    def feed_metrics(feed, values=None, unique_vals=None):
+        values = values or [0] * len(periods)
+        unique_vals = unique_vals or [0] * len(periods)
         return {
             "feed": feed,
             "total": {p: int(values[i] or 0) for i, p in enumerate(periods)},
             "unique": {p: int(unique_vals[i]) for i, p in enumerate(periods)}
         }
 
-    # Check each feed's health
-    async def feed_health(url):
-        try:
-            data = await fetch_tracks(url)
-            return (True, data if data else [])
-        except Exception:
-            return (False, [])
-
-    feeds = ["east", "west", "worship", "fourth", "fifth", "sixth"]
-    feed_urls = [
-        SOURCE_EAST,
-        SOURCE_WEST,
-        SOURCE_THIRD,
-        SOURCE_FOURTH,
-        SOURCE_FIFTH,
-        SOURCE_SIXTH,
-    ]
-    metrics = await asyncio.gather(*(get_feed_metrics(f) for f in feeds))
-    health_checks = await asyncio.gather(*(feed_health(url) for url in feed_urls))
-
-    # Determine status for each feed
-    status_map = {}
-    overall_status = "ok"
-    for name, (healthy, data) in zip(feeds, health_checks):
-        if not healthy or not data:
-            status_map[name] = "error"
-            overall_status = "error"
-        else:
-            status_map[name] = "ok"
+    feeds = list(FEEDS)
 
+    counter_names = [
+        "cache:feed:l1_hit", "cache:feed:l2_hit", "cache:feed:miss",
+        "cache:cover:l1_hit", "cache:cover:l2_hit", "cache:cover:miss",
+        "cache:feed:coalesced", "cache:cover:coalesced",
+        "bytes_saved:response", "bytes_saved:redis",
+    ]
+    metrics = [feed_metrics(f) for f in feeds]
+    counters = dict.fromkeys(counter_names, 0)
+    cache_size = {}
+    itunes_breaker_last = {}
+    last_feed_check = None
+    last_feed_checks = {f: None for f in feeds}
+    health = {f: feed_health.get(f) for f in feeds}
+    latency_raws = None
     if rdb_available:
         try:
-            cache_feed_keys = await rdb.keys("feed:*")
-            cache_cover_keys = await rdb.keys("cover:*")
-
-            cache_hit_feed = await rdb.get("metrics:cache:feed:hit") or 0
-            cache_miss_feed = await rdb.get("metrics:cache:feed:miss") or 0
-            cache_hit_cover = await rdb.get("metrics:cache:cover:hit") or 0
-            cache_miss_cover = await rdb.get("metrics:cache:cover:miss") or 0
-
-            # Include last check times
-            last_feed_check = await rdb.get('last_feed_check')
-            last_feed_check_east = await rdb.get('last_feed_check:east')
-            last_feed_check_west = await rdb.get('last_feed_check:west')
-            last_feed_check_worship = await rdb.get('last_feed_check:worship')
-            last_feed_check_fourth = await rdb.get('last_feed_check:fourth')
-            last_feed_check_fifth = await rdb.get('last_feed_check:fifth')
-            last_feed_check_sixth = await rdb.get('last_feed_check:sixth')
+            # Every dashboard read goes out in a single round trip.
+            per_feed = 1 + len(periods)
+            pipe = rdb.pipeline(transaction=False)
+            for f in feeds:
+                queue_feed_metrics(pipe, f)
+            pipe.mget(*(f"metrics:{name}" for name in counter_names))
+            pipe.hgetall(CACHE_SIZE_KEY)
+            pipe.hgetall("breaker:itunes")
+            pipe.get("last_feed_check")
+            pipe.mget(*(f"last_feed_check:{f}" for f in feeds))
+            latency_keys = recent_latency_keys()
+            for key in latency_keys:
+                pipe.hgetall(key)
+            for f in feeds:
+                pipe.hgetall(f"{HEALTH_KEY_PREFIX}{f}")
+            results = await pipe.execute()
+            metrics = [
+                feed_metrics(f, results[i * per_feed], results[i * per_feed + 1:(i + 1) * per_feed])
+                for i, f in enumerate(feeds)
+            ]
+            counter_vals, cache_size, itunes_breaker_last, last_feed_check, check_vals, *rest = results[len(feeds) * per_feed:]
+            latency_raws, health_vals = rest[:len(latency_keys)], rest[len(latency_keys):]
+            counters = {name: int(v or 0) for name, v in zip(counter_names, counter_vals)}
+            last_feed_checks = dict(zip(feeds, check_vals))
+            health = {f: record or health[f] for f, record in zip(feeds, health_vals)}
         except Exception:
-            cache_feed_keys = []
-            cache_cover_keys = []
-            cache_hit_feed = cache_miss_feed = 0
-            cache_hit_cover = cache_miss_cover = 0
-            last_feed_check = last_feed_check_east = None
-            last_feed_check_west = last_feed_check_worship = None
-            last_feed_check_fourth = last_feed_check_fifth = None
-            last_feed_check_sixth = None
             logging.warning("Redis became unavailable during dashboard request")
-    else:
-        cache_feed_keys = []
-        cache_cover_keys = []
-        cache_hit_feed = cache_miss_feed = 0
-        cache_hit_cover = cache_miss_cover = 0
-        last_feed_check = last_feed_check_east = None
-        last_feed_check_west = last_feed_check_worship = None
-        last_feed_check_fourth = last_feed_check_fifth = None
-        last_feed_check_sixth = None
+    sizes_counted_at = cache_size.get("counted_at")
+
+    latency = {
+        stage: {
+            "count": histogram.count,
+            **{f"p{int(q * 100)}": histogram.quantile(q) * 1000 for q in (0.5, 0.95, 0.99)},
+        }
+        for stage, histogram in recent_latency(latency_raws).items() if histogram.count
+    }
+
+    status_map = {f: health_status(f, health[f]) for f in feeds}
+    overall_status = "error" if any(status in ("error", "stale") for status in status_map.values()) else "ok"
+    health_details = {
+        f: {
+            "latency_ms": int(record.get("latency_ms", 0)),
+            "size": int(record.get("size", 0)),
+            "tracks": int(record.get("tracks", 0)),
+            "error": record.get("error") or "",
+            "last_success": (
+                datetime.fromtimestamp(int(record["last_success"])).strftime("%Y-%m-%d %H:%M:%S")
+                if record.get("last_success") else None
+            ),
+        }
+        for f, record in health.items() if record
+    }
 
     metrics_dict = {
         "timestamp": now,
         "feeds": metrics,
         "cache": {
-            "feed_keys": len(cache_feed_keys),
-            "cover_keys": len(cache_cover_keys),
+            "feed_keys": int(cache_size.get("feed", 0)),
+            "cover_keys": int(cache_size.get("cover", 0)),
+            "keys_counted_at": (
+                datetime.fromtimestamp(int(sizes_counted_at)).strftime("%H:%M:%S") if sizes_counted_at else None
+            ),
+            "l1_entries": {
+                "feed": len(feed_l1),
+                "cover": len(cover_l1),
+            },
             "hits": {
-                "feed": int(cache_hit_feed),
-                "cover": int(cache_hit_cover),
+                "feed": counters["cache:feed:l1_hit"] + counters["cache:feed:l2_hit"],
+                "cover": counters["cache:cover:l1_hit"] + counters["cache:cover:l2_hit"],
+            },
+            "l1_hits": {
+                "feed": counters["cache:feed:l1_hit"],
+                "cover": counters["cache:cover:l1_hit"],
+            },
+            "l2_hits": {
+                "feed": counters["cache:feed:l2_hit"],
+                "cover": counters["cache:cover:l2_hit"],
             },
             "misses": {
-                "feed": int(cache_miss_feed),
-                "cover": int(cache_miss_cover),
+                "feed": counters["cache:feed:miss"],
+                "cover": counters["cache:cover:miss"],
+            },
+            "coalesced": {
+                "feed": counters["cache:feed:coalesced"],
+                "cover": counters["cache:cover:coalesced"],
+            },
+            "bytes_saved": {
+                "response": counters["bytes_saved:response"],
+                "redis": counters["bytes_saved:redis"],
             }
         },
+        "itunes": {
+            "breaker_state": itunes_breaker.state,
+            "breaker_failures": itunes_breaker.failures,
+            "rate_limited": itunes_rate_limiter.denied,
+            "last_transition": itunes_breaker_last,
+        },
+        "streams": {
+            "clients": len(feed_broadcaster),
+            "evicted": feed_broadcaster.evicted,
+            "per_feed": {f: feed_broadcaster.count(f) for f in feeds},
+        },
         "status": overall_status,
+        "latency": latency,
+        "latency_window": LATENCY_WINDOW_MINUTES,
         "feed_status": status_map,
+        "feed_health": health_details,
         "last_feed_check": last_feed_check,
-        "last_feed_check_east": last_feed_check_east,
-        "last_feed_check_west": last_feed_check_west,
-        "last_feed_check_worship": last_feed_check_worship,
-        "last_feed_check_fourth": last_feed_check_fourth,
-        "last_feed_check_fifth": last_feed_check_fifth,
-        "last_feed_check_sixth": last_feed_check_sixth
+        "last_feed_checks": last_feed_checks,
     }
 
     return templates.TemplateResponse(
         "admin_dashboard.html",
-        {"request": request, "metrics": metrics_dict}
+        {"request": request, "metrics": metrics_dict, "feeds": FEEDS}
     )
 
 @app.get("/admin/test-alert")
@@ -992,9 +2961,8 @@ async def trigger_test_alert(credentials: HTTPBasicCredentials = Depends(securit
     }
 
     try:
-        async with httpx.AsyncClient(timeout=5) as client:
-            r = await client.post("https://events.pagerduty.com/v2/enqueue", json=payload)
-            return {"status": "sent", "response": r.status_code}
+        r = await get_http_client("pagerduty").post("https://events.pagerduty.com/v2/enqueue", json=payload)
+        return {"status": "sent", "response": r.status_code}
     except Exception as e:
         logging.error(f"Failed to send PagerDuty alert: {e}")
         return {"status": "error", "message": str(e)}
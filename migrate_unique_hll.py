@@ -0,0 +1,136 @@
+"""Migrate unique-listener sets to HyperLogLogs and compare their memory.
+
+Unique listeners used to be tracked in Redis sets ``unique:{feed}:{period}:...``
+holding every client IP. The app now writes HyperLogLogs under
+``hll:unique:{feed}:{period}:...``. This script copies each old set into the
+matching HLL (keeping its TTL) so week/month/year counts carry over, and
+reports the memory used by both::
+
+    python migrate_unique_hll.py              # migrate, keep the old sets
+    python migrate_unique_hll.py --delete     # migrate, then delete the old sets
+    python migrate_unique_hll.py --dry-run    # only report
+
+``--simulate N`` stores N synthetic listener IPs as a set and as an HLL in
+scratch keys, then prints the memory of each and the HLL's count error, to
+size the change at a given listener volume::
+
+    python migrate_unique_hll.py --simulate 50000
+
+Memory figures need a Redis server that supports ``MEMORY USAGE``.
+"""
+
+import argparse
+import ipaddress
+import os
+
+import redis
+
+OLD_PATTERN = "unique:*"
+NEW_PREFIX = "hll:"
+# TTL for migrated keys whose set had none (the old sets used 14 days).
+DEFAULT_TTL = 1209600
+BATCH = 1000
+
+
+def memory_usage(rdb, key):
+    try:
+        return rdb.memory_usage(key, samples=0) or 0
+    except redis.ResponseError:
+        return None
+
+
+def human(n):
+    if n is None:
+        return "n/a"
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if n < 1024 or unit == "GiB":
+            return f"{n:.1f} {unit}" if unit != "B" else f"{n} B"
+        n /= 1024
+
+
+def migrate(rdb, delete=False, dry_run=False):
+    sets = hlls = members = 0
+    old_bytes = new_bytes = 0
+    measured = True
+    for key in rdb.scan_iter(match=OLD_PATTERN, count=BATCH, _type="set"):
+        target = NEW_PREFIX + key
+        size = memory_usage(rdb, key)
+        measured = measured and size is not None
+        old_bytes += size or 0
+        sets += 1
+        if dry_run:
+            members += rdb.scard(key)
+            continue
+        for chunk in _sscan_chunks(rdb, key):
+            rdb.pfadd(target, *chunk)
+            members += len(chunk)
+        ttl = rdb.pttl(key)
+        rdb.pexpire(target, ttl if ttl and ttl > 0 else DEFAULT_TTL * 1000)
+        size = memory_usage(rdb, target)
+        measured = measured and size is not None
+        new_bytes += size or 0
+        hlls += 1
+        if delete:
+            rdb.delete(key)
+
+    print(f"{sets} sets with {members} members{' (dry run)' if dry_run else ''}")
+    if not dry_run:
+        print(f"{hlls} HyperLogLogs written{', old sets deleted' if delete else ''}")
+    if measured:
+        print(f"memory: sets {human(old_bytes)}" + ("" if dry_run else f", HLLs {human(new_bytes)}"))
+    else:
+        print("memory: MEMORY USAGE not supported by this server")
+
+
+def _sscan_chunks(rdb, key):
+    chunk = []
+    for member in rdb.sscan_iter(key, count=BATCH):
+        chunk.append(member)
+        if len(chunk) >= BATCH:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def simulate(rdb, listeners):
+    set_key, hll_key = "migrate_unique_hll:sim:set", "migrate_unique_hll:sim:hll"
+    rdb.delete(set_key, hll_key)
+    try:
+        base = int(ipaddress.IPv4Address("10.0.0.0"))
+        for start in range(0, listeners, BATCH):
+            ips = [str(ipaddress.IPv4Address(base + i * 7919)) for i in range(start, min(start + BATCH, listeners))]
+            pipe = rdb.pipeline(transaction=False)
+            pipe.sadd(set_key, *ips)
+            pipe.pfadd(hll_key, *ips)
+            pipe.execute()
+        exact, estimate = rdb.scard(set_key), rdb.pfcount(hll_key)
+        set_bytes, hll_bytes = memory_usage(rdb, set_key), memory_usage(rdb, hll_key)
+    finally:
+        rdb.delete(set_key, hll_key)
+
+    print(f"{listeners} synthetic listeners in one key")
+    print(f"  set: {human(set_bytes):>10}  count {exact}")
+    print(f"  HLL: {human(hll_bytes):>10}  count {estimate} ({(estimate - exact) / max(exact, 1):+.2%})")
+    if set_bytes and hll_bytes:
+        print(f"  HLL is {set_bytes / hll_bytes:.0f}x smaller")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate unique-listener sets to HyperLogLogs.")
+    parser.add_argument("--host", default=os.getenv("REDIS_HOST", "localhost"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("REDIS_PORT", "6379")))
+    parser.add_argument("--delete", action="store_true", help="delete each set after migrating it")
+    parser.add_argument("--dry-run", action="store_true", help="report without writing anything")
+    parser.add_argument("--simulate", type=int, metavar="N", help="compare memory for N synthetic listeners")
+    args = parser.parse_args()
+
+    rdb = redis.Redis(host=args.host, port=args.port, decode_responses=True)
+    if args.simulate:
+        simulate(rdb, args.simulate)
+    else:
+        migrate(rdb, delete=args.delete, dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# main.py resolves feeds.json, album_lookup.csv and templates/ relative to
+# the working directory, as when it is run from the repository root.
+os.chdir(ROOT)
+sys.path.insert(0, ROOT)
@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+import main
+
+
+@pytest.fixture
+def covers(monkeypatch):
+    monkeypatch.setattr(main, "rdb_available", False)
+    main.cover_l1.clear()
+    yield main.cover_l1
+    main.cover_l1.clear()
+
+
+def _cache(covers, *albums):
+    keys = {album: main.cover_cache_keys("Artist", album, "Song")[0] for album in albums}
+    for key in keys.values():
+        covers.set(key, {"imageUrl": "https://art.example/a.jpg"})
+    return keys
+
+
+def test_invalidation_drops_old_and_new_csv_albums(covers):
+    keys = _cache(covers, "Old Album", "New Album", "Tag Album", "Song")
+    asyncio.run(main._invalidate_album_covers([("Artist", "Song", "Old Album", "New Album")]))
+    assert covers.get(keys["Old Album"]) is None
+    assert covers.get(keys["New Album"]) is None
+    # Entries keyed by the TALB tag or the title are not the CSV's to drop.
+    assert covers.get(keys["Tag Album"]) is not None
+    assert covers.get(keys["Song"]) is not None
+
+
+def test_invalidation_of_added_and_removed_rows(covers):
+    keys = _cache(covers, "Added", "Removed", "Song")
+    asyncio.run(main._invalidate_album_covers([
+        ("Artist", "Song", None, "Added"),
+        ("Artist", "Song", "Removed", None),
+    ]))
+    assert covers.get(keys["Added"]) is None
+    assert covers.get(keys["Removed"]) is None
+    assert covers.get(keys["Song"]) is not None
+
+
+def test_cover_keys_fall_back_to_title():
+    assert main.cover_cache_keys("Artist", "", "Song") == main.cover_cache_keys("Artist", "Song")
+    assert main.cover_cache_keys("Artist", "Album", "Song") != main.cover_cache_keys("Artist", "", "Song")
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+import main
+
+TRACKS = [("Artist A", "Album A", "Song A"), ("Artist B", "Album B", "Song B")]
+
+
+@pytest.fixture
+def artwork_env(monkeypatch):
+    monkeypatch.setattr(main, "rdb_available", False)
+    monkeypatch.setattr(main, "artwork_generation", 0)
+    monkeypatch.setattr(main, "_artwork_queued", set())
+    main.cover_l1.clear()
+    yield main
+    main.cover_l1.clear()
+
+
+def _run_worker(resolve, monkeypatch):
+    monkeypatch.setattr(main, "resolve_album_art", resolve)
+
+    async def run():
+        main.artwork_queue = asyncio.Queue(maxsize=8)
+        try:
+            results = await main.lookup_album_art_batch(TRACKS[:1], block=False)
+            worker = asyncio.create_task(main.artwork_worker())
+            await main.artwork_queue.join()
+            worker.cancel()
+            return results
+        finally:
+            main.artwork_queue = None
+
+    return asyncio.run(run())
+
+
+def test_worker_bumps_generation_when_cover_is_stored(artwork_env, monkeypatch):
+    async def found(artist, album, title=None):
+        return {"imageUrl": "https://art.example/a.jpg", "itunesTrackUrl": "", "previewUrl": ""}
+
+    results = _run_worker(found, monkeypatch)
+    assert results[0]["artworkPending"] is True
+    assert main.artwork_generation == 1
+    assert not main._artwork_queued
+
+
+@pytest.mark.parametrize("outcome", [None, main.ITunesSkipped("rate limited"), RuntimeError("boom")])
+def test_worker_keeps_generation_when_nothing_is_stored(artwork_env, monkeypatch, outcome):
+    async def resolve(artist, album, title=None):
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    _run_worker(resolve, monkeypatch)
+    assert main.artwork_generation == 0
+    assert not main._artwork_queued
+
+
+def test_dropped_job_is_not_reported_pending(artwork_env):
+    async def run():
+        main.artwork_queue = asyncio.Queue(maxsize=1)
+        try:
+            return await main.lookup_album_art_batch(TRACKS, block=False)
+        finally:
+            main.artwork_queue = None
+
+    queued, dropped = asyncio.run(run())
+    assert queued["artworkPending"] is True
+    assert dropped["imageUrl"] == main.FALLBACK_IMAGE
+    assert "artworkPending" not in dropped
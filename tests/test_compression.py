@@ -0,0 +1,20 @@
+import main
+
+
+def test_negotiate_encoding_prefers_brotli():
+    assert main.negotiate_encoding("gzip, deflate, br", {"gzip", "br"}) == "br"
+    assert main.negotiate_encoding("gzip, deflate, br", {"gzip"}) == "gzip"
+
+
+def test_negotiate_encoding_honours_q_values():
+    assert main.negotiate_encoding("br;q=0.5, gzip", {"gzip", "br"}) == "gzip"
+    assert main.negotiate_encoding("br;q=0, gzip;q=0", {"gzip", "br"}) is None
+    assert main.negotiate_encoding("gzip;q=bogus", {"gzip"}) is None
+
+
+def test_negotiate_encoding_wildcard_and_identity():
+    assert main.negotiate_encoding("*", {"gzip"}) == "gzip"
+    assert main.negotiate_encoding("*;q=0, gzip", {"gzip", "br"}) == "gzip"
+    assert main.negotiate_encoding("identity", {"gzip", "br"}) is None
+    assert main.negotiate_encoding("", {"gzip"}) is None
+    assert main.negotiate_encoding("gzip", {}) is None
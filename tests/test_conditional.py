@@ -0,0 +1,49 @@
+import time
+from email.utils import formatdate
+
+from starlette.requests import Request
+
+import main
+
+
+def _request(**headers):
+    raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+def _rendered(**encoded):
+    return main.RenderedFeed(
+        body=b"{}",
+        signature="sig",
+        rendered_at=0.0,
+        checked_at=0.0,
+        fetched_at=0.0,
+        etag='"abc123"',
+        last_modified=1_700_000_000.0,
+        encoded=encoded,
+    )
+
+
+def test_not_modified_matches_any_variant_etag():
+    rendered = _rendered(gzip=b"g", br=b"b")
+    for tag in ('"abc123"', 'W/"abc123"', main._variant_etag(rendered, "gzip"), main._variant_etag(rendered, "br")):
+        assert main._not_modified(_request(if_none_match=tag), rendered), tag
+    assert main._not_modified(_request(if_none_match='"other", "abc123"'), rendered)
+    assert main._not_modified(_request(if_none_match="*"), rendered)
+    assert not main._not_modified(_request(if_none_match='"other"'), rendered)
+    assert not main._not_modified(_request(), rendered)
+
+
+def test_not_modified_if_modified_since():
+    rendered = _rendered()
+    last = rendered.last_modified
+    assert main._not_modified(_request(if_modified_since=formatdate(last, usegmt=True)), rendered)
+    assert main._not_modified(_request(if_modified_since=formatdate(last + 60, usegmt=True)), rendered)
+    assert not main._not_modified(_request(if_modified_since=formatdate(last - 60, usegmt=True)), rendered)
+    assert not main._not_modified(_request(if_modified_since="not a date"), rendered)
+
+
+def test_not_modified_if_none_match_takes_precedence():
+    rendered = _rendered()
+    request = _request(if_none_match='"other"', if_modified_since=formatdate(time.time(), usegmt=True))
+    assert not main._not_modified(request, rendered)
@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+import feed_registry
+
+
+def _write(tmp_path, data, name="feeds.json"):
+    path = tmp_path / name
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return str(path)
+
+
+def test_shipped_registry_loads():
+    feeds = feed_registry.load_feeds("feeds.json")
+    assert "east" in feeds
+    assert all(feed.source.startswith("https://") for feed in feeds.values())
+
+
+def test_defaults_are_layered(tmp_path):
+    path = _write(tmp_path, {
+        "defaults": {"poll_interval": 20},
+        "feeds": [
+            {"name": "east", "source": "https://a.example/east.json", "concurrency": 0},
+            {"name": "west", "source": "https://a.example/west.json", "label": "West", "poll_interval": 5},
+        ],
+    })
+    feeds = feed_registry.load_feeds(path, {"poll_interval": 10, "soft_ttl": 15})
+    assert list(feeds) == ["east", "west"]
+    east, west = feeds["east"], feeds["west"]
+    # Entry, then the file's defaults, then the caller's, then built-ins.
+    assert (east.poll_interval, west.poll_interval) == (20.0, 5.0)
+    assert (east.soft_ttl, east.hard_ttl) == (15, 3600)
+    assert (east.label, west.label) == ("East", "West")
+    assert east.concurrency == 1
+
+
+@pytest.mark.parametrize("feeds, message", [
+    ([{"name": "East-1", "source": "https://a.example"}], "invalid feed name"),
+    ([{"name": "east"}], "has no source"),
+    ([{"name": "east", "source": "https://a.example"}] * 2, "duplicate feed"),
+])
+def test_bad_entries_raise(tmp_path, feeds, message):
+    path = _write(tmp_path, {"feeds": feeds})
+    with pytest.raises(ValueError, match=message):
+        feed_registry.load_feeds(path)
+
+
+def test_yaml_registry(tmp_path):
+    pytest.importorskip("yaml")
+    path = tmp_path / "feeds.yaml"
+    path.write_text("feeds:\n  - name: east\n    source: https://a.example/east.json\n", encoding="utf-8")
+    assert feed_registry.load_feeds(str(path))["east"].source == "https://a.example/east.json"
+
+
+def test_default_path_from_environment(monkeypatch):
+    monkeypatch.delenv("FEED_REGISTRY", raising=False)
+    assert feed_registry.default_path() == "feeds.json"
+    monkeypatch.setenv("FEED_REGISTRY", "/etc/feeds.yaml")
+    assert feed_registry.default_path() == "/etc/feeds.yaml"
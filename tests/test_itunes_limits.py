@@ -0,0 +1,132 @@
+import asyncio
+
+import httpx
+import pytest
+
+import main
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake ``time.monotonic``; advance it with ``clock[0] += seconds``."""
+    now = [1000.0]
+    monkeypatch.setattr(main, "rdb_available", False)
+    monkeypatch.setattr(main.time, "monotonic", lambda: now[0])
+    return now
+
+
+# RateLimiter
+
+
+def test_rate_limiter_denies_past_burst_and_refills(clock):
+    limiter = main.RateLimiter("ratelimit:test", per_minute=60, burst=2)
+    assert [asyncio.run(limiter.acquire()) for _ in range(3)] == [1, 1, 0]
+    assert limiter.denied == 1
+    clock[0] += 1
+    assert asyncio.run(limiter.acquire()) == 1
+    assert asyncio.run(limiter.acquire()) == 0
+
+
+def test_rate_limiter_grants_extra_tokens_above_reserve(clock):
+    limiter = main.RateLimiter("ratelimit:test", per_minute=60, burst=5)
+    # One token, plus two more that still leave the reserve of two.
+    assert asyncio.run(limiter.acquire(want=4, reserve=2)) == 3
+    # Below the reserve only the first token is granted.
+    assert asyncio.run(limiter.acquire(want=4, reserve=2)) == 1
+    assert asyncio.run(limiter.acquire(want=4, reserve=2)) == 1
+    assert asyncio.run(limiter.acquire(want=4, reserve=2)) == 0
+
+
+def test_rate_limiter_lua_matches_local_bucket(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    monkeypatch.setattr(main, "rdb", fakeredis.FakeAsyncRedis(decode_responses=True))
+    monkeypatch.setattr(main, "rdb_available", True)
+    limiter = main.RateLimiter("ratelimit:test", per_minute=0.001, burst=5)
+
+    async def run():
+        return [await limiter.acquire(want=4, reserve=2) for _ in range(4)]
+
+    assert asyncio.run(run()) == [3, 1, 1, 0]
+
+
+# CircuitBreaker
+
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = main.CircuitBreaker("test", failure_threshold=2, reset_timeout=30)
+    breaker.record_failure()
+    assert breaker.state == "closed" and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+
+def test_breaker_success_resets_failure_count(clock):
+    breaker = main.CircuitBreaker("test", failure_threshold=2, reset_timeout=30)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+
+def test_breaker_half_open_lets_one_probe_through(clock):
+    breaker = main.CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock[0] += 31
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    assert not breaker.allow()
+    breaker.release()
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow() and breaker.allow()
+
+
+def test_breaker_failed_probe_reopens(clock):
+    breaker = main.CircuitBreaker("test", failure_threshold=3, reset_timeout=30)
+    for _ in range(3):
+        breaker.record_failure()
+    clock[0] += 31
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+
+# itunes_get
+
+
+@pytest.fixture
+def itunes(clock, monkeypatch):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={"results": []})
+
+    monkeypatch.setattr(main, "itunes_breaker", main.CircuitBreaker("test", failure_threshold=1, reset_timeout=30))
+    monkeypatch.setattr(main, "itunes_rate_limiter", main.RateLimiter("ratelimit:test", per_minute=0.001, burst=1))
+    client = main.create_http_client("itunes", transport=httpx.MockTransport(handler))
+    return client, calls
+
+
+def test_itunes_get_skips_when_breaker_is_open(itunes):
+    client, calls = itunes
+    main.itunes_breaker.record_failure()
+    with pytest.raises(main.ITunesSkipped):
+        asyncio.run(main.itunes_get(client, "https://itunes.example/search", {}))
+    assert not calls
+
+
+def test_itunes_get_skips_when_rate_limited_and_frees_the_probe(itunes, clock):
+    client, calls = itunes
+    assert asyncio.run(main.itunes_get(client, "https://itunes.example/search", {})).status_code == 200
+    main.itunes_breaker.record_failure()
+    clock[0] += 31
+    with pytest.raises(main.ITunesSkipped):
+        asyncio.run(main.itunes_get(client, "https://itunes.example/search", {}))
+    assert len(calls) == 1
+    # The unused half-open probe slot was given back.
+    assert main.itunes_breaker.allow()
@@ -0,0 +1,39 @@
+import main
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = main.LRUCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the oldest
+    cache.set("c", 3)
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+
+def test_lru_cache_expires_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(main.time, "monotonic", lambda: now[0])
+    cache = main.LRUCache(maxsize=10, ttl=30)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=5)
+    cache.set("c", 3, ttl=300)  # capped at the cache TTL
+    now[0] += 10
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    now[0] += 25
+    assert cache.get("a") is None
+    assert cache.get("c") is None
+    assert len(cache) == 0
+
+
+def test_lru_cache_delete_and_clear():
+    cache = main.LRUCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.delete("a")
+    cache.delete("missing")
+    assert cache.get("a") is None
+    cache.clear()
+    assert len(cache) == 0
@@ -0,0 +1,68 @@
+from collections import OrderedDict
+
+import main
+
+
+def _counts(at=None):
+    """Per-bucket counts with ``at[bucket index] = count``."""
+    counts = [0] * (len(main.LATENCY_BUCKETS) + 1)
+    for index, n in (at or {}).items():
+        counts[index] = n
+    return counts
+
+
+def test_histogram_quantile_interpolates_within_bucket():
+    buckets = main.LATENCY_BUCKETS
+    counts = _counts({2: 10})
+    assert main.histogram_quantile(0.5, counts) == buckets[1] + (buckets[2] - buckets[1]) * 0.5
+    assert main.histogram_quantile(1.0, counts) == buckets[2]
+
+
+def test_histogram_quantile_first_bucket_starts_at_zero():
+    assert main.histogram_quantile(0.5, _counts({0: 4})) == main.LATENCY_BUCKETS[0] / 2
+
+
+def test_histogram_quantile_spans_buckets():
+    buckets = main.LATENCY_BUCKETS
+    counts = _counts({0: 90, 5: 10})
+    assert main.histogram_quantile(0.5, counts) < buckets[0]
+    assert buckets[4] < main.histogram_quantile(0.95, counts) <= buckets[5]
+
+
+def test_histogram_quantile_edge_cases():
+    inf = len(main.LATENCY_BUCKETS)
+    assert main.histogram_quantile(0.99, _counts()) == 0.0
+    assert main.histogram_quantile(0.5, _counts({inf: 3})) == main.LATENCY_BUCKETS[-1]
+
+
+def test_recent_latency_keys_cover_the_window(monkeypatch):
+    monkeypatch.setattr(main, "LATENCY_WINDOW_MINUTES", 3)
+    assert main.recent_latency_keys(now=600.0 * 60 + 30) == [
+        f"{main.LATENCY_KEY}:598",
+        f"{main.LATENCY_KEY}:599",
+        f"{main.LATENCY_KEY}:600",
+    ]
+
+
+def test_recent_latency_sums_minute_hashes():
+    raws = [
+        {"render|2": "3", "render|count": "3", "render|sum_us": "6000"},
+        None,
+        {"render|2": "1", "render|count": "1", "render|sum_us": "2000"},
+    ]
+    histogram = main.recent_latency(raws)["render"]
+    assert histogram.count == 4
+    assert histogram.counts[2] == 4
+
+
+def test_recent_latency_skips_minutes_outside_the_window(monkeypatch):
+    monkeypatch.setattr(main, "LATENCY_WINDOW_MINUTES", 2)
+    monkeypatch.setattr(main, "latency_minutes", OrderedDict())
+    minute = int(main.time.time() // 60)
+    for offset, seconds in ((-5, 5.0), (0, 0.002)):
+        histogram = main.LatencyHistogram()
+        histogram.observe(seconds)
+        main.latency_minutes[minute + offset] = {"render": histogram}
+    histogram = main.recent_latency()["render"]
+    assert histogram.count == 1
+    assert histogram.quantile(0.5) <= 0.0025
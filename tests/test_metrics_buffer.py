@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+import main
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.commands.append((name, *args))
+
+    async def execute(self):
+        self.redis.attempts += 1
+        await asyncio.sleep(0)
+        if self.redis.down:
+            raise ConnectionError("redis down")
+        self.redis.executed.extend(self.commands)
+
+
+class FakeRedis:
+    def __init__(self, down=False):
+        self.down = down
+        self.attempts = 0
+        self.executed = []
+
+    def pipeline(self, transaction=False):
+        return FakePipeline(self)
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(main, "rdb", fake)
+    monkeypatch.setattr(main, "rdb_available", True)
+    return fake
+
+
+def test_flush_writes_one_pipeline(redis):
+    buffer = main.MetricsBuffer(flush_events=1000, max_pending=100)
+    buffer.incr("hits", 2)
+    buffer.incr("hits")
+    buffer.hincr("metrics:latency:1", "render|count", ttl=60)
+    buffer.pfadd("hll:day", "a", 86400)
+    buffer.pfadd("hll:day", "a", 86400)
+    asyncio.run(buffer.flush())
+    assert redis.attempts == 1
+    assert ("incrby", "hits", 3) in redis.executed
+    assert ("hincrby", "metrics:latency:1", "render|count", 1) in redis.executed
+    assert ("expire", "metrics:latency:1", 60) in redis.executed
+    assert ("pfadd", "hll:day", "a") in redis.executed
+    assert len(buffer) == 0
+
+
+def test_failed_flush_keeps_batch(redis):
+    buffer = main.MetricsBuffer(flush_events=1000, max_pending=100)
+    buffer.incr("hits", 5)
+    buffer.pfadd("hll:day", "a", 86400)
+    redis.down = True
+    asyncio.run(buffer.flush())
+    assert buffer.failures == 1
+    buffer.incr("hits")
+    redis.down = False
+    asyncio.run(buffer.flush())
+    assert buffer.failures == 0
+    assert ("incrby", "hits", 6) in redis.executed
+    assert ("pfadd", "hll:day", "a") in redis.executed
+
+
+def test_failed_flush_backs_off(redis):
+    redis.down = True
+    buffer = main.MetricsBuffer(flush_events=1000, max_pending=5000)
+    for i in range(1200):
+        buffer.pfadd("hll:day", str(i), 86400)
+
+    async def run():
+        task = asyncio.create_task(buffer.run(0.05))
+        await asyncio.sleep(0.5)
+        buffer.stop()
+        await task
+
+    asyncio.run(run())
+    # An early flush for the 1200 IDs, then 0.1 s, 0.2 s, 0.4 s back-off;
+    # a restored batch must not wake the loop again straight away.
+    assert 2 <= redis.attempts <= 4
+    assert len(buffer) == 1200
+    assert buffer.retry_delay(1.0) == 2.0 ** buffer.failures
+
+
+def test_retry_delay_is_capped(monkeypatch):
+    monkeypatch.setattr(main, "METRICS_FLUSH_BACKOFF_MAX_MS", 30000)
+    buffer = main.MetricsBuffer(flush_events=1000, max_pending=100)
+    assert buffer.retry_delay(1.0) == 1.0
+    buffer.failures = 3
+    assert buffer.retry_delay(1.0) == 8.0
+    buffer.failures = 5000
+    assert buffer.retry_delay(1.0) == 30.0
+
+
+def test_buffer_is_bounded_across_slot_types():
+    buffer = main.MetricsBuffer(flush_events=1000, max_pending=3)
+    buffer.incr("a")
+    buffer.hincr("metrics:latency:1", "render|count")
+    buffer.pfadd("hll:day", "x", 86400)
+    buffer.incr("b")
+    buffer.hincr("metrics:latency:2", "render|count")
+    buffer.pfadd("hll:day", "y", 86400)
+    assert len(buffer) == 3
+    assert buffer.dropped == 3
+    # Slots already held keep counting.
+    buffer.incr("a", 4)
+    buffer.pfadd("hll:day", "x", 86400)
+    assert buffer._counters["a"] == 5
+    assert buffer.dropped == 3
+
+
+def test_restore_respects_bound(redis):
+    buffer = main.MetricsBuffer(flush_events=1000, max_pending=2)
+    buffer.incr("a")
+    buffer.incr("b")
+    redis.down = True
+
+    async def run():
+        flush = asyncio.create_task(buffer.flush())
+        await asyncio.sleep(0)
+        # Updates arriving during a failing flush share the bound with the batch.
+        buffer.incr("c")
+        await flush
+
+    asyncio.run(run())
+    assert len(buffer) == 2
+    assert buffer.dropped == 1
+    assert "c" in buffer._counters
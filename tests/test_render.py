@@ -0,0 +1,117 @@
+import asyncio
+import hashlib
+from datetime import datetime
+
+import pytest
+
+import main
+
+POOL_SIZE = 130
+WINDOW = 25
+SHIFTS = 100
+
+
+def _pool():
+    tracks = []
+    start = 1_700_000_000
+    for i in range(POOL_SIZE):
+        track = {
+            "TPE1": f"Artist {i % 17}",
+            "TIT2": f"Song {i}",
+            "TALB": f"Album {i % 5}" if i % 3 else "",
+            "duration": f"00:0{2 + i % 4}:{i % 60:02d}",
+        }
+        if i % 7:
+            track["played_on"] = str(start + i * 200)
+        if i % 11 == 0:
+            track["TPE1"] = "Family Radio"
+        tracks.append(track)
+    return tracks
+
+
+async def _fake_lookup(tracks, block=True, limit=None, **kwargs):
+    results = []
+    for artist, album, title in tracks:
+        digest = hashlib.sha1(f"{artist}|{album}|{title}".encode()).hexdigest()
+        if digest[0] in "01":
+            # Some tracks never resolve, so they are rebuilt on every render.
+            results.append({**main.EMPTY_META, "imageUrl": main.FALLBACK_IMAGE})
+        else:
+            results.append({
+                "imageUrl": f"https://art.example/{digest}.jpg",
+                "itunesTrackUrl": f"https://music.example/{digest}",
+                "previewUrl": "",
+            })
+    return results
+
+
+class _FrozenDatetime(datetime):
+    # The newest track falls back to now() when it has no timestamp.
+    @classmethod
+    def now(cls, tz=None):
+        return cls.fromtimestamp(1_700_100_000, tz)
+
+
+@pytest.fixture
+def render_env(monkeypatch):
+    monkeypatch.setattr(main, "datetime", _FrozenDatetime)
+    monkeypatch.setattr(main, "rdb_available", False)
+    monkeypatch.setattr(main, "lookup_album_art_batch", _fake_lookup)
+    monkeypatch.setattr(main, "spec_item_cache", {})
+    return main
+
+
+def test_incremental_render_matches_full_render(render_env):
+    pool = _pool()
+
+    async def run():
+        for shift in range(SHIFTS):
+            # Upstream lists are newest first and gain one track per song.
+            window = list(reversed(pool[shift:shift + WINDOW]))
+            full = await main.to_spec_format(window)
+            incremental = await main.to_spec_format(window, feed="test")
+            assert main._encode_feed(incremental) == main._encode_feed(full), shift
+
+    asyncio.run(run())
+    assert main.spec_item_cache["test"]
+
+
+def test_incremental_render_reuses_items(render_env, monkeypatch):
+    pool = _pool()
+    lookups = []
+
+    async def counting_lookup(tracks, **kwargs):
+        lookups.append(len(tracks))
+        return await _fake_lookup(tracks, **kwargs)
+
+    monkeypatch.setattr(main, "lookup_album_art_batch", counting_lookup)
+    window = [t for t in reversed(pool[:WINDOW]) if t["TPE1"] != "Family Radio"]
+
+    async def run():
+        await main.to_spec_format(window, feed="test")
+        first = lookups[-1]
+        await main.to_spec_format(window, feed="test")
+        return first
+
+    first = asyncio.run(run())
+    cached = len(main.spec_item_cache["test"])
+    assert first == len(window)
+    # Only tracks without final artwork are looked up again.
+    assert lookups[-1] == len(window) - cached
+
+
+def test_incremental_render_does_not_mutate_cached_items(render_env):
+    pool = _pool()
+    window = list(reversed(pool[1:WINDOW + 1]))
+    shifted = list(reversed(pool[:WINDOW]))
+
+    async def run():
+        await main.to_spec_format(window, feed="test")
+        before = {key: dict(item) for key, item in main.spec_item_cache["test"].items()}
+        await main.to_spec_format(shifted, feed="test")
+        return before
+
+    before = asyncio.run(run())
+    for key, item in main.spec_item_cache["test"].items():
+        if key in before:
+            assert item == before[key]
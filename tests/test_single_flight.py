@@ -0,0 +1,70 @@
+import asyncio
+
+import main
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    flight = main.SingleFlight("test")
+    runs = []
+
+    async def work(value):
+        runs.append(value)
+        await asyncio.sleep(0.01)
+        return value * 2
+
+    async def run():
+        return await asyncio.gather(*(flight.do("k", work, 21) for _ in range(10)))
+
+    assert asyncio.run(run()) == [42] * 10
+    assert runs == [21]
+    assert (flight.calls, flight.coalesced) == (1, 9)
+    assert not flight.in_flight("k")
+
+
+def test_single_flight_keys_are_independent_and_not_cached():
+    flight = main.SingleFlight("test")
+
+    async def work(value):
+        await asyncio.sleep(0)
+        return value
+
+    async def run():
+        first = await asyncio.gather(flight.do("a", work, 1), flight.do("b", work, 2))
+        second = await flight.do("a", work, 3)
+        return first, second
+
+    assert asyncio.run(run()) == ([1, 2], 3)
+    assert (flight.calls, flight.coalesced) == (3, 0)
+
+
+def test_single_flight_shares_exceptions():
+    flight = main.SingleFlight("test")
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def run():
+        return await asyncio.gather(*(flight.do("k", fail) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, ValueError) for r in results)
+    assert flight.calls == 1
+    assert not flight.in_flight("k")
+
+
+def test_single_flight_cancelled_waiter_keeps_shared_call():
+    flight = main.SingleFlight("test")
+
+    async def work():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def run():
+        leader = asyncio.ensure_future(flight.do("k", work))
+        waiter = asyncio.ensure_future(flight.do("k", work))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        return await leader
+
+    assert asyncio.run(run()) == "done"
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+import main
+
+
+def _rendered(etag):
+    return main.RenderedFeed(body=b"{}", signature="", rendered_at=0.0, checked_at=0.0, fetched_at=0.0, etag=etag)
+
+
+# Broadcaster
+
+
+def test_publish_reaches_every_subscriber():
+    broadcaster = main.Broadcaster(queue_size=2)
+    first, second = broadcaster.subscribe("east"), broadcaster.subscribe("east")
+    other = broadcaster.subscribe("west")
+    broadcaster.publish("east", _rendered('"a"'))
+    assert first.get_nowait().etag == second.get_nowait().etag == '"a"'
+    assert other.empty()
+    assert (len(broadcaster), broadcaster.count("east")) == (3, 2)
+
+
+def test_full_queue_evicts_only_that_subscriber():
+    broadcaster = main.Broadcaster(queue_size=2)
+    slow, fast = broadcaster.subscribe("east"), broadcaster.subscribe("east")
+    for etag in ('"a"', '"b"'):
+        broadcaster.publish("east", _rendered(etag))
+        fast.get_nowait()
+    broadcaster.publish("east", _rendered('"c"'))
+    assert broadcaster.evicted == 1
+    assert broadcaster.count("east") == 1
+    # The backlog is dropped and replaced by the end-of-stream marker.
+    assert slow.get_nowait() is None and slow.empty()
+    assert fast.get_nowait().etag == '"c"'
+
+
+def test_close_ends_every_stream():
+    broadcaster = main.Broadcaster(queue_size=2)
+    queues = [broadcaster.subscribe("east"), broadcaster.subscribe("west")]
+    broadcaster.publish("east", _rendered('"a"'))
+    broadcaster.close()
+    assert [queue.get_nowait() for queue in queues] == [None, None]
+    assert len(broadcaster) == 0
+
+
+# FeedStreamResponse
+
+
+@pytest.fixture
+def fast_heartbeat(monkeypatch):
+    monkeypatch.setattr(main, "FEED_STREAM_HEARTBEAT", 0.05)
+    monkeypatch.setattr(main, "feed_broadcaster", main.Broadcaster(queue_size=2))
+
+
+def test_stalled_client_is_dropped(fast_heartbeat):
+    closed = []
+
+    async def events():
+        try:
+            while True:
+                yield b": keep-alive\n\n"
+        finally:
+            closed.append(True)
+
+    async def stalled_send(message):
+        if message["type"] == "http.response.body":
+            await asyncio.sleep(3600)
+
+    response = main.FeedStreamResponse(events(), media_type="text/event-stream")
+    asyncio.run(asyncio.wait_for(response.stream_response(stalled_send), 2))
+    assert closed == [True]
+    assert main.feed_broadcaster.evicted == 1
+
+
+def test_responsive_client_gets_every_chunk(fast_heartbeat):
+    sent = []
+
+    async def events():
+        for chunk in (b"a", b"b"):
+            yield chunk
+
+    async def send(message):
+        sent.append(message.get("body"))
+
+    response = main.FeedStreamResponse(events(), media_type="text/event-stream")
+    asyncio.run(response.stream_response(send))
+    assert sent == [None, b"a", b"b", b""]
+    assert main.feed_broadcaster.evicted == 0
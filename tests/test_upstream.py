@@ -0,0 +1,60 @@
+import asyncio
+
+import httpx
+import pytest
+
+import main
+
+SOURCE = "https://upstream.example/east.json"
+TRACKS = [{"TPE1": "Family Radio", "TIT2": "Station ID", "played_on": "1700000000"}]
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Serve ``state["response"]`` from the mocked upstream feed host."""
+    state = {"response": httpx.Response(200, json=TRACKS)}
+    monkeypatch.setattr(main, "rdb_available", False)
+    monkeypatch.setattr(main, "rendered_feeds", {})
+    monkeypatch.setattr(main, "spec_item_cache", {})
+    monkeypatch.setattr(main, "FEED_TTLS", {"test": (0, 3600)})
+    monkeypatch.setitem(
+        main.http_clients,
+        "upstream",
+        main.create_http_client("upstream", transport=httpx.MockTransport(lambda request: state["response"])),
+    )
+    main.feed_l1.clear()
+    yield state
+    main.feed_l1.clear()
+
+
+def _refresh():
+    # Drop the cached upstream copy so every refresh goes upstream.
+    main.feed_l1.clear()
+    return asyncio.run(main.refresh_rendered_feed("test", SOURCE))
+
+
+def test_failed_fetch_returns_none(upstream):
+    upstream["response"] = httpx.Response(502)
+    data, _ = asyncio.run(main.fetch_tracks_with_age(SOURCE, 0, 3600))
+    assert data is None
+    assert asyncio.run(main.fetch_tracks(SOURCE, 0, 3600)) == []
+
+
+def test_failed_fetch_keeps_last_payload(upstream):
+    first = _refresh()
+    assert b"Station ID" in first.body
+    upstream["response"] = httpx.Response(502)
+    assert _refresh() is first
+
+
+def test_empty_upstream_replaces_last_payload(upstream):
+    _refresh()
+    upstream["response"] = httpx.Response(200, json=[])
+    rendered = _refresh()
+    assert rendered.body == main._encode_feed([])
+    assert main.rendered_feeds["test"] is rendered
+
+
+def test_failed_fetch_without_payload_renders_empty(upstream):
+    upstream["response"] = httpx.Response(502)
+    assert _refresh().body == main._encode_feed([])